@@ -9,6 +9,7 @@ from flask_wtf.csrf import CSRFProtect
 from flask_talisman import Talisman
 from flask_caching import Cache
 from typing import Optional
+import re
 import sys
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -20,6 +21,9 @@ from app.utils.endpoint_url_fallbacks import install_endpoint_url_for_fallback
 from app.utils.csp_manager import init_csp
 from app.utils.rate_limiter import init_limiter, create_rate_limit_error_handler
 
+# Fallback slug pattern, compiled once rather than on every filter call
+_NON_SLUG_CHARS = re.compile(r'[^a-z0-9]+')
+
 
 def safe_console_log(message: str, fallback: Optional[str] = None) -> None:
     """Print startup/runtime messages without crashing on limited terminals."""
@@ -224,6 +228,11 @@ def register_jinja_filters(app: Flask) -> None:
             return ''
         return value.strftime(format_str)
 
+    try:
+        from slugify import slugify as python_slugify
+    except ImportError:
+        python_slugify = None
+
     @app.template_filter('slugify')
     def slugify_filter(value: object) -> str:
         """Generate URL-safe slugs in templates."""
@@ -231,13 +240,10 @@ def register_jinja_filters(app: Flask) -> None:
             return ''
 
         text = str(value)
-        try:
-            from slugify import slugify as python_slugify
+        if python_slugify is not None:
             return python_slugify(text)
-        except ImportError:
-            # Lightweight fallback keeps templates functional if dependency is unavailable.
-            import re
-            return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+        # Lightweight fallback keeps templates functional if dependency is unavailable.
+        return _NON_SLUG_CHARS.sub('-', text.lower()).strip('-')
 
 
 def configure_email_from_db(app: Flask) -> None:
@@ -6,13 +6,44 @@ To start the Celery worker:
 
 Note: Use --pool=solo on Windows due to Celery's limitations with multiprocessing on Windows.
 """
+import re
+import smtplib
+from datetime import datetime
+from celery import group
 from flask import render_template
 from flask_mail import Message
 from app.celery_config import celery
 from app import app, mail
+from app.models import OwnerProfile, Newsletter
 
+# Subscribers per send_newsletter_batch task when fanning out a newsletter
+NEWSLETTER_BATCH_SIZE = 50
 
-@celery.task(bind=True, name='tasks.email_tasks.send_contact_email', max_retries=3)
+# Crude tag stripper for the plain-text newsletter fallback
+HTML_TAG_RE = re.compile('<[^<]+?>')
+
+
+def mail_suppressed():
+    """Return True when tests have suppressed sending, so bodies need not be built."""
+    return bool(app.config.get('TESTING') and app.config.get('MAIL_SUPPRESS_SEND'))
+
+
+def report_contact_email_failure(self, exc, task_id, args, kwargs, einfo):
+    """Log a contact email that failed for good (retries exhausted or non-retryable error)."""
+    print(f"Failed to send contact email after {self.request.retries} retries: {exc}")
+
+
+@celery.task(
+    bind=True,
+    name='tasks.email_tasks.send_contact_email',
+    max_retries=3,
+    # Exponential backoff: up to 30s/60s/120s, jittered, capped at 10 minutes
+    autoretry_for=(smtplib.SMTPException, ConnectionError),
+    retry_backoff=30,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    on_failure=report_contact_email_failure
+)
 def send_contact_email(self, contact_data):
     """
     Async task to send contact form email.
@@ -26,29 +57,34 @@ def send_contact_email(self, contact_data):
             - project_type (str, optional): Type of project inquiry
             
     Returns:
-        dict: Result status with success/failure information
+        dict: Result status on success. Failures no longer return a
+            {'success': False} dict.
         
     Raises:
-        Exception: If email sending fails after max retries
+        smtplib.SMTPException, ConnectionError: If sending still fails after
+            max retries (retried automatically with exponential backoff); the
+            task then fails and is reported through on_failure
     """
-    try:
-        # Extract contact data
-        name = contact_data.get('name')
-        email = contact_data.get('email')
-        subject = contact_data.get('subject')
-        message_body = contact_data.get('message')
-        project_type = contact_data.get('projectType', 'Not specified')
-        
-        # Create email message
-        msg = Message(
-            subject=f"Portfolio Contact: {subject}",
-            sender=app.config.get('MAIL_DEFAULT_SENDER', 'noreply@portfolio.com'),
-            recipients=[app.config.get('CONTACT_EMAIL', app.config.get('MAIL_USERNAME'))],
-            reply_to=email
-        )
-        
-        # Create HTML body
-        msg.html = f"""
+    if mail_suppressed():
+        return {'success': True, 'suppressed': True, 'task_id': self.request.id}
+    
+    # Extract contact data
+    name = contact_data.get('name')
+    email = contact_data.get('email')
+    subject = contact_data.get('subject')
+    message_body = contact_data.get('message')
+    project_type = contact_data.get('projectType', 'Not specified')
+    
+    # Create email message
+    msg = Message(
+        subject=f"Portfolio Contact: {subject}",
+        sender=app.config.get('MAIL_DEFAULT_SENDER', 'noreply@portfolio.com'),
+        recipients=[app.config.get('CONTACT_EMAIL', app.config.get('MAIL_USERNAME'))],
+        reply_to=email
+    )
+    
+    # Create HTML body
+    msg.html = f"""
         <html>
             <head>
                 <meta charset="UTF-8">
@@ -108,9 +144,9 @@ def send_contact_email(self, contact_data):
             </body>
         </html>
         """
-        
-        # Create plain text version
-        msg.body = f"""
+    
+    # Create plain text version
+    msg.body = f"""
 New Contact Form Submission
 ============================
 
@@ -126,31 +162,16 @@ Message:
 This email was sent from your portfolio contact form.
 Reply directly to this email to respond to {name}.
         """
-        
-        # Send email
-        with app.app_context():
-            mail.send(msg)
-        
-        return {
-            'success': True,
-            'message': f'Email sent successfully to {name}',
-            'task_id': self.request.id
-        }
-        
-    except Exception as exc:
-        # Log the error
-        print(f"Error sending email: {exc}")
-        
-        # Retry with exponential backoff (30s, 60s, 120s)
-        try:
-            raise self.retry(exc=exc, countdown=30 * (2 ** self.request.retries))
-        except self.MaxRetriesExceededError:
-            # Max retries exceeded, return failure
-            return {
-                'success': False,
-                'error': f'Failed to send email after {self.max_retries} retries: {str(exc)}',
-                'task_id': self.request.id
-            }
+    
+    # Send email
+    with app.app_context():
+        mail.send(msg)
+    
+    return {
+        'success': True,
+        'message': f'Email sent successfully to {name}',
+        'task_id': self.request.id
+    }
 
 
 @celery.task(name='tasks.email_tasks.send_newsletter_confirmation')
@@ -166,12 +187,14 @@ def send_newsletter_confirmation(email, name, confirmation_token):
     Returns:
         dict: Result status
     """
+    if mail_suppressed():
+        return {'success': True, 'email': email, 'suppressed': True}
+    
     try:
-        from datetime import datetime
+        year = datetime.now().year
         
         with app.app_context():
             # Get site configuration
-            from app.models import OwnerProfile
             owner = OwnerProfile.query.first()
             
             site_url = app.config.get('SITE_URL', 'http://localhost:5000')
@@ -186,7 +209,7 @@ def send_newsletter_confirmation(email, name, confirmation_token):
                 unsubscribe_url=unsubscribe_url,
                 site_url=site_url,
                 owner_name=owner.name if owner else 'Portfolio Owner',
-                year=datetime.now().year
+                year=year
             )
             
             # Create plain text version
@@ -201,7 +224,7 @@ If you didn't request this subscription, you can safely ignore this email.
 
 ---
 This email was sent because you subscribed to the newsletter at {site_url}
-© {datetime.now().year} {owner.name if owner else 'Portfolio Owner'}. All rights reserved.
+© {year} {owner.name if owner else 'Portfolio Owner'}. All rights reserved.
             """.strip()
             
             msg = Message(
@@ -240,12 +263,14 @@ def send_newsletter(subscriber_email, newsletter_content):
     Returns:
         dict: Result status
     """
+    if mail_suppressed():
+        return {'success': True, 'email': subscriber_email, 'suppressed': True}
+    
     try:
-        from datetime import datetime
+        year = datetime.now().year
         
         with app.app_context():
             # Get site configuration
-            from app.models import OwnerProfile, Newsletter
             owner = OwnerProfile.query.first()
             subscriber = Newsletter.query.filter_by(email=subscriber_email).first()
             
@@ -264,15 +289,14 @@ def send_newsletter(subscriber_email, newsletter_content):
                 site_url=site_url,
                 unsubscribe_url=unsubscribe_url,
                 owner_name=owner.name if owner else 'Portfolio Owner',
-                year=datetime.now().year
+                year=year
             )
             
             # Create plain text version
             text_body = newsletter_content.get('text_body', '')
             if not text_body:
                 # Simple conversion from HTML content
-                import re
-                text_body = re.sub('<[^<]+?>', '', newsletter_content.get('content', ''))
+                text_body = HTML_TAG_RE.sub('', newsletter_content.get('content', ''))
             
             msg = Message(
                 subject=newsletter_content.get('title', 'Newsletter'),
@@ -291,3 +315,40 @@ def send_newsletter(subscriber_email, newsletter_content):
         print(f"Error sending newsletter to {subscriber_email}: {exc}")
         return {'success': False, 'email': subscriber_email, 'error': str(exc)}
 
+
+@celery.task(name='tasks.email_tasks.send_newsletter_batch')
+def send_newsletter_batch(subscriber_emails, newsletter_content):
+    """
+    Async task to send a newsletter to a chunk of subscribers.
+    
+    Args:
+        subscriber_emails (list): Subscriber email addresses in this chunk
+        newsletter_content (dict): Newsletter content (see send_newsletter)
+        
+    Returns:
+        list: Per-subscriber result dicts from send_newsletter
+    """
+    return [send_newsletter(email, newsletter_content) for email in subscriber_emails]
+
+
+def dispatch_newsletter(subscriber_emails, newsletter_content, batch_size=NEWSLETTER_BATCH_SIZE):
+    """
+    Queue a newsletter for all subscribers as one Celery group.
+    
+    Subscribers are split into chunks of ``batch_size`` and each chunk becomes
+    a send_newsletter_batch task, so the caller pays one group submission
+    instead of one broker round-trip per subscriber.
+    
+    Args:
+        subscriber_emails (iterable): Subscriber email addresses
+        newsletter_content (dict): Newsletter content (see send_newsletter)
+        batch_size (int): Subscribers per batch task
+        
+    Returns:
+        GroupResult: Handle for the queued batch tasks
+    """
+    emails = list(subscriber_emails)
+    return group(
+        send_newsletter_batch.s(emails[i:i + batch_size], newsletter_content)
+        for i in range(0, len(emails), batch_size)
+    ).apply_async()
@@ -4,12 +4,47 @@ Provides test client, database setup, and authentication helpers.
 """
 import pytest
 import os
+from contextlib import contextmanager
+
+from flask import globals as flask_globals, template_rendered
+from sqlalchemy import event, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import close_all_sessions, scoped_session, sessionmaker
 
 # Set testing environment variable BEFORE importing app
 os.environ['FLASK_TESTING'] = '1'
 
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Drop SQLite durability guarantees; test databases are throwaway."""
+    if type(dbapi_connection).__module__ != 'sqlite3':
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=MEMORY')
+    cursor.execute('PRAGMA synchronous=OFF')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest inside the test transaction
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(Engine, 'begin')
+def _begin_sqlite_transaction(conn):
+    """Emit the BEGIN that pysqlite no longer issues implicitly."""
+    if conn.dialect.name == 'sqlite':
+        conn.exec_driver_sql('BEGIN')
+
+
 from app import app as flask_app, db, cache
-from app.models import OwnerProfile, SiteConfig, Product, RaspberryPiProject, BlogPost, Project
+from app.models import AdminRecoveryCode, OwnerProfile, SiteConfig, Product, RaspberryPiProject, BlogPost, Project
+
+# Precomputed generate_password_hash('admin123', method='pbkdf2:sha256:1'), so the
+# default admin login works without deriving a hash at startup
+DEFAULT_ADMIN_PASSWORD_HASH = (
+    'pbkdf2:sha256:1$mSEIddVVvfKjpua4$'
+    '09e4d7577fa3fd32a0c01488b92d3c6a959426c659e0ef21c542460f5cc17111'
+)
 
 
 @pytest.fixture(scope='session')
@@ -26,12 +61,23 @@ def app():
         'CACHE_TYPE': 'simple',
         'PREFERRED_URL_SCHEME': 'http',  # Disable HTTPS redirect in tests
         'SERVER_NAME': None,  # Don't force hostname
+        'ADMIN_USERNAME': 'admin',
+        'ADMIN_PASSWORD_HASH': DEFAULT_ADMIN_PASSWORD_HASH,
+        'TEMPLATES_AUTO_RELOAD': False,
     })
+    # The Jinja environment already exists by now, so the config flag alone
+    # would not stop it from stat()-ing template files on every render
+    flask_app.jinja_env.auto_reload = False
     
     # Initialize cache with app if not already done
     with flask_app.app_context():
         cache.init_app(flask_app)
     
+    # Compile the admin templates once up front instead of in the first
+    # test that happens to render each of them
+    for name in flask_app.jinja_env.list_templates(filter_func=lambda n: n.startswith('admin/')):
+        flask_app.jinja_env.get_template(name)
+    
     return flask_app
 
 
@@ -47,28 +93,80 @@ def runner(app):
     return app.test_cli_runner()
 
 
-@pytest.fixture(scope='function')
-def database(app):
-    """Create fresh database for each test"""
+def _app_ctx_scope():
+    """Scope sessions per app context, as Flask-SQLAlchemy does"""
+    return id(flask_globals.app_ctx._get_current_object())
+
+
+@contextmanager
+def transactional_db(flask_app, **session_options):
+    """Bind db.session to one connection and roll all its work back on exit.
+
+    Sessions join the outer transaction through a SAVEPOINT, so commits made
+    by the code under test only release that savepoint and are discarded with
+    the outer transaction. Extra keyword arguments go to the sessionmaker.
+    """
+    # Sessions opened by earlier fixtures would otherwise hold the shared
+    # StaticPool connection inside their own transaction
+    close_all_sessions()
+    with flask_app.app_context():
+        connection = db.engine.connect()
+    transaction = connection.begin()
+    original_session = db.session
+    db.session = scoped_session(
+        sessionmaker(bind=connection, join_transaction_mode='create_savepoint', **session_options),
+        scopefunc=_app_ctx_scope,
+    )
+    try:
+        yield connection
+    finally:
+        close_all_sessions()
+        db.session = original_session
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope='session')
+def _seeded_schema(app):
+    """Create the schema and seed rows once per test session"""
     with app.app_context():
         db.create_all()
-        
-        # Create test data
-        _create_test_owner()
-        _create_test_site_config()
-        _create_test_projects()
-        _create_test_products()
-        _create_test_rpi_projects()
-        _create_test_blog_posts()
-        
-        db.session.commit()
-        
-        yield db
-        
+        _seed_all()
         db.session.remove()
+    yield
+    with app.app_context():
         db.drop_all()
 
 
+@pytest.fixture(scope='function')
+def database(app, _seeded_schema):
+    """Give each test the seeded database inside a rolled-back transaction"""
+    with transactional_db(app), app.app_context():
+        yield db
+
+
+@pytest.fixture(scope='function')
+def recovery_codes(database):
+    """Five plain-text recovery codes, generated inside the test's rolled-back transaction"""
+    return AdminRecoveryCode.generate_codes(5)
+
+
+@pytest.fixture(scope='session')
+def sample_blog_post(app, _seeded_schema):
+    """Id of the seeded published post, looked up once for read-mostly tests"""
+    with app.app_context():
+        post_id = db.session.scalar(select(BlogPost.id).where(BlogPost.slug == 'test-blog-post-1'))
+        db.session.remove()
+    return post_id
+
+
+@pytest.fixture(scope='function')
+def modular_database(modular_app):
+    """Roll back everything a test writes through the requesting module's modular_app"""
+    with transactional_db(modular_app):
+        yield db
+
+
 @pytest.fixture(scope='function')
 def auth_client(client, app):
     """Create authenticated test client for admin routes"""
@@ -80,9 +178,68 @@ def auth_client(client, app):
     return client
 
 
+@pytest.fixture(scope='function')
+def captured_templates(app):
+    """Record (template, context) pairs for every template the app renders"""
+    recorded = []
+
+    def record(sender, template, context, **extra):
+        recorded.append((template, context))
+
+    template_rendered.connect(record, app)
+    try:
+        yield recorded
+    finally:
+        template_rendered.disconnect(record, app)
+
+
+@pytest.fixture(scope='function')
+def count_queries():
+    """Context manager factory collecting the SQL statements executed inside it"""
+    @contextmanager
+    def counter():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(Engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, 'before_cursor_execute', record)
+
+    return counter
+
+
+@pytest.fixture(scope='function')
+def assert_max_queries(count_queries):
+    """Context manager factory failing the test if its block runs more than `limit` statements"""
+    @contextmanager
+    def checker(limit):
+        with count_queries() as statements:
+            yield statements
+        assert len(statements) <= limit, (
+            f'{len(statements)} queries executed, expected at most {limit}:\n' + '\n'.join(statements)
+        )
+
+    return checker
+
+
+def _seed_all():
+    """Bulk-insert the shared seed rows in a single transaction"""
+    _create_test_owner()
+    _create_test_site_config()
+    _create_test_projects()
+    _create_test_products()
+    _create_test_rpi_projects()
+    _create_test_blog_posts()
+    db.session.commit()
+
+
 def _create_test_owner():
     """Create test owner profile"""
-    owner = OwnerProfile(
+    db.session.execute(insert(OwnerProfile).values(
         name='Test Developer',
         title='Senior Python Developer',
         bio='Test bio for portfolio',
@@ -100,13 +257,12 @@ def _create_test_owner():
         skills_json='["Python", "Flask", "SQLAlchemy", "JavaScript"]',
         experience_json='[{"title": "Senior Developer", "company": "Test Corp", "years": "2020-Present"}]',
         expertise_json='[{"title": "Backend Development", "description": "Python/Flask expertise"}]'
-    )
-    db.session.add(owner)
+    ))
 
 
 def _create_test_site_config():
     """Create test site configuration"""
-    config = SiteConfig(
+    db.session.execute(insert(SiteConfig).values(
         site_name='Test Portfolio',
         tagline='Python Developer Portfolio',
         mail_server='smtp.test.com',
@@ -118,14 +274,13 @@ def _create_test_site_config():
         blog_enabled=True,
         products_enabled=True,
         analytics_enabled=False
-    )
-    db.session.add(config)
+    ))
 
 
 def _create_test_projects():
     """Create test portfolio projects"""
-    projects = [
-        Project(
+    rows = [
+        dict(
             title='Test Portfolio Project 1',
             description='A test portfolio project for unit testing',
             technologies='Python,Flask,PostgreSQL',
@@ -135,32 +290,34 @@ def _create_test_projects():
             image_url='/static/images/project1.jpg',
             featured=True
         ),
-        Project(
+        dict(
             title='Test Portfolio Project 2',
             description='Another test project',
             technologies='Python,Django,MySQL',
             category='web',
             github_url='https://github.com/test/project2',
+            demo_url=None,
             image_url='/static/images/project2.jpg',
             featured=True
         ),
-        Project(
+        dict(
             title='Test Portfolio Project 3',
             description='Third test project',
             technologies='React,Node.js,MongoDB',
             category='fullstack',
             github_url='https://github.com/test/project3',
+            demo_url=None,
             image_url='/static/images/project3.jpg',
             featured=False
         )
     ]
-    db.session.add_all(projects)
+    db.session.execute(insert(Project), rows)
 
 
 def _create_test_products():
     """Create test products"""
-    products = [
-        Product(
+    rows = [
+        dict(
             name='Test Product 1',
             description='A test product for unit testing',
             price=29.99,
@@ -170,7 +327,7 @@ def _create_test_products():
             image_url='/static/images/product1.jpg',
             purchase_link='https://test.com/product1'
         ),
-        Product(
+        dict(
             name='Test Product 2',
             description='Another test product',
             price=49.99,
@@ -181,13 +338,13 @@ def _create_test_products():
             purchase_link='https://test.com/product2'
         )
     ]
-    db.session.add_all(products)
+    db.session.execute(insert(Product), rows)
 
 
 def _create_test_rpi_projects():
     """Create test Raspberry Pi projects"""
-    projects = [
-        RaspberryPiProject(
+    rows = [
+        dict(
             title='Test RPi Project 1',
             description='A test Raspberry Pi project',
             image_url='/static/images/rpi1.jpg',
@@ -196,7 +353,7 @@ def _create_test_rpi_projects():
             hardware_json='["Raspberry Pi 4", "Temperature Sensor"]',
             features_json='["Real-time monitoring", "GPIO control"]'
         ),
-        RaspberryPiProject(
+        dict(
             title='Test RPi Project 2',
             description='Another test project',
             image_url='/static/images/rpi2.jpg',
@@ -206,13 +363,13 @@ def _create_test_rpi_projects():
             features_json='["Photo capture", "Video streaming"]'
         )
     ]
-    db.session.add_all(projects)
+    db.session.execute(insert(RaspberryPiProject), rows)
 
 
 def _create_test_blog_posts():
     """Create test blog posts"""
-    posts = [
-        BlogPost(
+    rows = [
+        dict(
             title='Test Blog Post 1',
             slug='test-blog-post-1',
             content='# Test Post\n\nThis is test content for blog post 1.',
@@ -223,7 +380,7 @@ def _create_test_blog_posts():
             image_url='/static/images/blog1.jpg',
             published=True
         ),
-        BlogPost(
+        dict(
             title='Test Blog Post 2',
             slug='test-blog-post-2',
             content='# Another Test\n\nThis is test content for blog post 2.',
@@ -234,7 +391,7 @@ def _create_test_blog_posts():
             image_url='/static/images/blog2.jpg',
             published=True
         ),
-        BlogPost(
+        dict(
             title='Draft Post',
             slug='draft-post',
             content='# Draft\n\nThis is unpublished.',
@@ -246,7 +403,7 @@ def _create_test_blog_posts():
             published=False
         )
     ]
-    db.session.add_all(posts)
+    db.session.execute(insert(BlogPost), rows)
 
 
 @pytest.fixture
@@ -4,90 +4,104 @@ Tests login, logout, password reset, and security settings.
 """
 import pytest
 from werkzeug.security import generate_password_hash
-from app.models import AdminRecoveryCode
+from sqlalchemy import insert
+from app import admin_routes
+from app.models import db, AdminRecoveryCode
+
+
+ADMIN_PASSWORD = 'test_password_123'
+# Hashed once at import with a single PBKDF2 round; test logins need no KDF cost
+ADMIN_PASSWORD_HASH = generate_password_hash(ADMIN_PASSWORD, method='pbkdf2:sha256:1')
+# Well-formed single-iteration hash that never matches; for failure paths only
+DUMMY_HASH = 'pbkdf2:sha256:1$abc$' + '0' * 64
+
+LOGIN_URL = '/admin/login'
+LOGOUT_URL = '/admin/logout'
+FORGOT_PASSWORD_URL = '/admin/forgot-password'
+SECURITY_URL = '/admin/security'
+DASHBOARD_PATH = '/admin/dashboard'
+LOGIN_PAYLOAD = {'username': 'admin', 'password': ADMIN_PASSWORD}
+
+
+def _seed_codes(n):
+    """Insert n unused recovery-code rows directly; for count-only assertions"""
+    db.session.execute(
+        insert(AdminRecoveryCode),
+        [{'code_hash': f'stub{i}', 'used': False} for i in range(n)]
+    )
+    db.session.commit()
 
 
 # Fixture to set up admin credentials for login tests
 @pytest.fixture
-def admin_credentials(app):
-    """Set admin credentials in app config for testing"""
-    test_password = 'test_password_123'
-    test_hash = generate_password_hash(test_password)
-    app.config['ADMIN_USERNAME'] = 'admin'
-    app.config['ADMIN_PASSWORD_HASH'] = test_hash
-    return {'username': 'admin', 'password': test_password, 'hash': test_hash}
+def admin_credentials(app, monkeypatch):
+    """Set admin credentials in app config for the duration of one test"""
+    monkeypatch.setitem(app.config, 'ADMIN_USERNAME', 'admin')
+    monkeypatch.setitem(app.config, 'ADMIN_PASSWORD_HASH', ADMIN_PASSWORD_HASH)
+    return {'username': 'admin', 'password': ADMIN_PASSWORD, 'hash': ADMIN_PASSWORD_HASH}
+
+
+@pytest.fixture
+def fast_route_hash(monkeypatch):
+    """Have the admin routes hash new passwords with one PBKDF2 round for this test"""
+    monkeypatch.setattr(
+        admin_routes, 'generate_password_hash',
+        lambda password: generate_password_hash(password, method='pbkdf2:sha256:1')
+    )
+
+
+@pytest.fixture
+def logged_in_client(client, admin_credentials):
+    """Client that has already logged in through the real login form"""
+    response = client.post(LOGIN_URL, data=LOGIN_PAYLOAD)
+    assert response.status_code == 302
+    assert DASHBOARD_PATH in response.location
+    return client
 
 
 class TestAdminLogin:
     """Test admin login functionality."""
     
-    def test_login_page_loads(self, client, database):
+    def test_login_page_loads(self, client):
         """Should load login page."""
-        response = client.get('/admin/login')
+        response = client.get(LOGIN_URL)
         assert response.status_code == 200
         assert b'login' in response.data.lower()
     
-    def test_login_success_with_valid_credentials(self, client, database, admin_credentials):
-        """Should login successfully with valid credentials."""
-        response = client.post('/admin/login', data={
-            'username': admin_credentials['username'],
-            'password': admin_credentials['password']
-        }, follow_redirects=False)
-        
-        assert response.status_code == 302
-        assert '/admin/dashboard' in response.location
-    
-    def test_login_failure_with_invalid_password(self, client, database, monkeypatch):
-        """Should fail login with wrong password."""
-        test_hash = generate_password_hash('correct_password')
-        
-        monkeypatch.setenv('ADMIN_USERNAME', 'admin')
-        monkeypatch.setenv('ADMIN_PASSWORD_HASH', test_hash)
-        
-        response = client.post('/admin/login', data={
-            'username': 'admin',
-            'password': 'wrong_password'
-        }, follow_redirects=True)
-        
-        assert response.status_code == 200
-        assert b'Invalid credentials' in response.data
-    
-    def test_login_failure_with_invalid_username(self, client, database, monkeypatch):
-        """Should fail login with wrong username."""
-        test_hash = generate_password_hash('test_password')
+    @pytest.mark.parametrize('username,password,expected_status,expected_location', [
+        ('admin', ADMIN_PASSWORD, 302, DASHBOARD_PATH),
+        ('admin', 'wrong_password', 200, None),
+        ('wrong_user', ADMIN_PASSWORD, 200, None),
+    ], ids=['valid', 'invalid-password', 'invalid-username'])
+    def test_login_flow(self, client, database, app, admin_credentials, monkeypatch,
+                        username, password, expected_status, expected_location):
+        """Should redirect on valid credentials and re-render with an error otherwise."""
+        if expected_location is None:
+            # Failure paths never need a real hash verification
+            monkeypatch.setitem(app.config, 'ADMIN_PASSWORD_HASH', DUMMY_HASH)
         
-        monkeypatch.setenv('ADMIN_USERNAME', 'admin')
-        monkeypatch.setenv('ADMIN_PASSWORD_HASH', test_hash)
-        
-        response = client.post('/admin/login', data={
-            'username': 'wrong_user',
-            'password': 'test_password'
-        }, follow_redirects=True)
+        response = client.post(LOGIN_URL, data={
+            'username': username,
+            'password': password
+        }, follow_redirects=False)
         
-        assert response.status_code == 200
-        assert b'Invalid credentials' in response.data
+        assert response.status_code == expected_status
+        if expected_location:
+            assert expected_location in response.location
+        else:
+            assert b'Invalid credentials' in response.data
     
-    def test_login_redirect_when_already_logged_in(self, client, database, admin_credentials):
+    def test_login_redirect_when_already_logged_in(self, logged_in_client, database):
         """Should redirect to dashboard if already logged in."""
-        # First login
-        client.post('/admin/login', data={
-            'username': admin_credentials['username'],
-            'password': admin_credentials['password']
-        })
-        
-        # Try to access login page again
-        response = client.get('/admin/login', follow_redirects=False)
+        response = logged_in_client.get(LOGIN_URL, follow_redirects=False)
         assert response.status_code == 302
-        assert '/admin/dashboard' in response.location
+        assert DASHBOARD_PATH in response.location
     
     def test_login_with_remember_me(self, client, database, admin_credentials):
         """Should set permanent session with remember me."""
         with client:
-            response = client.post('/admin/login', data={
-                'username': admin_credentials['username'],
-                'password': admin_credentials['password'],
-                'remember': 'on'
-            }, follow_redirects=False)
+            response = client.post(LOGIN_URL, data={**LOGIN_PAYLOAD, 'remember': 'on'},
+                                   follow_redirects=False)
             
             assert response.status_code == 302
             with client.session_transaction() as sess:
@@ -97,10 +111,7 @@ class TestAdminLogin:
     def test_login_without_remember_me(self, client, database, admin_credentials):
         """Should use shorter session without remember me."""
         with client:
-            response = client.post('/admin/login', data={
-                'username': admin_credentials['username'],
-                'password': admin_credentials['password']
-            }, follow_redirects=False)
+            response = client.post(LOGIN_URL, data=LOGIN_PAYLOAD, follow_redirects=False)
             
             assert response.status_code == 302
             with client.session_transaction() as sess:
@@ -113,7 +124,7 @@ class TestAdminLogin:
         monkeypatch.setattr('app.routes.admin.auth.get_admin_username', lambda: 'admin')
         monkeypatch.setattr('app.routes.admin.auth.get_admin_password_hash', lambda: None)
         
-        response = client.post('/admin/login', data={
+        response = client.post(LOGIN_URL, data={
             'username': 'admin',
             'password': 'test_password'
         }, follow_redirects=True)
@@ -125,55 +136,42 @@ class TestAdminLogin:
 class TestAdminLogout:
     """Test admin logout functionality."""
     
-    def test_logout_clears_session(self, client, database, admin_credentials):
+    def test_logout_clears_session(self, logged_in_client, database):
         """Should clear session on logout."""
-        with client:
-            # Login first
-            client.post('/admin/login', data={
-                'username': admin_credentials['username'],
-                'password': admin_credentials['password']
-            })
-            
-            # Verify logged in
-            with client.session_transaction() as sess:
-                assert sess.get('admin_logged_in') is True
-            
-            # Logout
-            _ = client.get('/admin/logout', follow_redirects=False)
-            
-            # Check session cleared (should be None after logout)
-            with client.session_transaction() as sess:
-                assert sess.get('admin_logged_in') is None
+        logged_in_client.get(LOGOUT_URL, follow_redirects=False)
+        
+        # Check session cleared (should be None after logout)
+        with logged_in_client.session_transaction() as sess:
+            assert sess.get('admin_logged_in') is None
     
-    def test_logout_redirects_to_login(self, client, database):
+    def test_logout_redirects_to_login(self, client):
         """Should redirect to login page after logout."""
-        response = client.get('/admin/logout', follow_redirects=False)
+        response = client.get(LOGOUT_URL, follow_redirects=False)
         assert response.status_code == 302
-        assert '/admin/login' in response.location
+        assert LOGIN_URL in response.location
     
-    def test_logout_shows_success_message(self, client, database):
+    def test_logout_shows_success_message(self, client):
         """Should show logout success message."""
-        response = client.get('/admin/logout', follow_redirects=True)
+        response = client.get(LOGOUT_URL, follow_redirects=True)
         assert response.status_code == 200
         assert b'logged out' in response.data
 
 
+@pytest.mark.usefixtures('fast_route_hash')
 class TestForgotPassword:
     """Test password reset functionality."""
     
     def test_forgot_password_page_loads(self, client, database):
         """Should load forgot password page."""
-        response = client.get('/admin/forgot-password')
+        response = client.get(FORGOT_PASSWORD_URL)
         assert response.status_code == 200
         assert b'password' in response.data.lower()
     
-    def test_forgot_password_with_valid_recovery_code(self, client, database):
+    def test_forgot_password_with_valid_recovery_code(self, client, database, recovery_codes):
         """Should reset password with valid recovery code."""
-        # Generate recovery codes
-        codes = AdminRecoveryCode.generate_codes(5)
-        valid_code = codes[0]
+        valid_code = recovery_codes[0]
         
-        response = client.post('/admin/forgot-password', data={
+        response = client.post(FORGOT_PASSWORD_URL, data={
             'recovery_code': valid_code,
             'new_password': 'new_secure_password_123'
         }, follow_redirects=True)
@@ -184,27 +182,30 @@ class TestForgotPassword:
     
     def test_forgot_password_with_invalid_recovery_code(self, client, database):
         """Should reject invalid recovery code."""
-        response = client.post('/admin/forgot-password', data={
+        response = client.post(FORGOT_PASSWORD_URL, data={
             'recovery_code': 'invalid_code_12345',
             'new_password': 'new_password_123'
         }, follow_redirects=True)
         
         assert response.status_code == 200
         # The form should still be present after invalid code (not showing new hash)
-        assert b'recovery code' in response.data.lower() or b'password' in response.data.lower()
+        page = response.data.lower()
+        assert b'recovery code' in page or b'password' in page
     
     def test_forgot_password_legacy_fallback_without_code(self, client, database):
         """Should generate hash in legacy mode without recovery code."""
-        response = client.post('/admin/forgot-password', data={
+        response = client.post(FORGOT_PASSWORD_URL, data={
             'new_password': 'new_password_123'
         }, follow_redirects=True)
         
         assert response.status_code == 200
-        assert b'legacy fallback' in response.data.lower()
+        page = response.data.lower()
+        assert b'legacy fallback' in page
+        assert b'no recovery codes available' in page
     
     def test_forgot_password_requires_new_password(self, client, database):
         """Should require new password field."""
-        response = client.post('/admin/forgot-password', data={
+        response = client.post(FORGOT_PASSWORD_URL, data={
             'recovery_code': 'some_code'
         }, follow_redirects=True)
         
@@ -213,22 +214,21 @@ class TestForgotPassword:
     
     def test_forgot_password_shows_remaining_codes(self, client, database):
         """Should display remaining recovery codes count."""
-        # Generate some codes
-        AdminRecoveryCode.generate_codes(3)
+        _seed_codes(3)
         
-        response = client.get('/admin/forgot-password')
+        response = client.get(FORGOT_PASSWORD_URL)
         assert response.status_code == 200
-        # Should show that codes are available
+        assert b'3 code(s) remaining' in response.data
 
 
 class TestSecuritySettings:
     """Test security settings page."""
     
-    def test_security_page_requires_login(self, client, database):
+    def test_security_page_requires_login(self, client):
         """Should require login to access security settings."""
-        response = client.get('/admin/security', follow_redirects=False)
+        response = client.get(SECURITY_URL, follow_redirects=False)
         assert response.status_code == 302
-        assert '/admin/login' in response.location
+        assert LOGIN_URL in response.location
     
     def test_security_page_loads_when_logged_in(self, client, database, monkeypatch):
         """Should load security page when logged in."""
@@ -237,9 +237,10 @@ class TestSecuritySettings:
             sess['admin_logged_in'] = True
         
         # Access security page
-        response = client.get('/admin/security')
+        response = client.get(SECURITY_URL)
         assert response.status_code == 200
-        assert b'security' in response.data.lower() or b'recovery' in response.data.lower()
+        page = response.data.lower()
+        assert b'security' in page or b'recovery' in page
     
     def test_generate_recovery_codes(self, client, database, monkeypatch):
         """Should generate new recovery codes."""
@@ -248,26 +249,27 @@ class TestSecuritySettings:
             sess['admin_logged_in'] = True
         
         # Generate codes
-        response = client.post('/admin/security', data={
+        response = client.post(SECURITY_URL, data={
             'action': 'generate_codes'
         }, follow_redirects=True)
         
         assert response.status_code == 200
-        assert b'recovery codes generated' in response.data.lower() or b'codes' in response.data.lower()
+        # 'codes' also matches 'recovery codes generated'
+        assert b'codes' in response.data.lower()
         
         # Verify codes were created in database
         remaining = AdminRecoveryCode.get_remaining_count()
         assert remaining == 10
     
-    def test_security_page_shows_remaining_codes(self, client, database, monkeypatch):
+    def test_security_page_shows_remaining_codes(self, client, database):
         """Should display remaining codes count."""
-        # Generate some codes
-        AdminRecoveryCode.generate_codes(5)
-        
         # Set session directly to simulate logged in state
         with client.session_transaction() as sess:
             sess['admin_logged_in'] = True
         
+        _seed_codes(5)
+        
         # Check page shows count
-        response = client.get('/admin/security')
+        response = client.get(SECURITY_URL)
         assert response.status_code == 200
+        assert b'5 / 10' in response.data
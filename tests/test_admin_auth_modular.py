@@ -7,44 +7,80 @@ These tests target routes/admin/auth.py through app_factory.create_app().
 from __future__ import annotations
 
 from datetime import timedelta
+from types import SimpleNamespace
 
 import pytest
+from sqlalchemy.pool import StaticPool
 from werkzeug.security import generate_password_hash
 
 from app.app_factory import create_app
 from app.models import db
 from app.routes.admin import auth as auth_routes
 
+# Hashed once at import with a single PBKDF2 round instead of once per test
+_HASH = generate_password_hash('correct-password', method='pbkdf2:sha256:1')
 
-@pytest.fixture
+
+@pytest.fixture(scope='session')
 def modular_app():
     app = create_app('testing')
     app.config.update(
         TESTING=True,
-        SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
         WTF_CSRF_ENABLED=False,
         SECRET_KEY='test-secret-key',
         ADMIN_USERNAME='admin',
-        ADMIN_PASSWORD_HASH=generate_password_hash('correct-password'),
+        ADMIN_PASSWORD_HASH=_HASH,
         REMEMBER_COOKIE_DURATION=timedelta(days=7),
     )
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
-
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
+    return app
 
 
 @pytest.fixture
-def modular_client(modular_app):
+def modular_client(modular_app, modular_database):
     return modular_app.test_client()
 
 
+@pytest.fixture
+def fast_route_hash(monkeypatch):
+    """Have the auth routes hash new passwords with one PBKDF2 round for this test."""
+    monkeypatch.setattr(
+        auth_routes, 'generate_password_hash',
+        lambda password: generate_password_hash(password, method='pbkdf2:sha256:1'),
+    )
+
+
+@pytest.fixture
+def recovery_stub(monkeypatch):
+    """Stub AdminRecoveryCode's storage; tests steer it through the returned state."""
+    state = SimpleNamespace(valid_code='VALID-CODE', remaining=3)
+
+    def verify_and_use(code):
+        if code != state.valid_code:
+            return False
+        state.remaining -= 1
+        return True
+
+    def generate_codes(count):
+        state.remaining = count
+        return [f'CODE{i}' for i in range(count)]
+
+    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'verify_and_use', staticmethod(verify_and_use))
+    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'get_remaining_count', staticmethod(lambda: state.remaining))
+    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'generate_codes', staticmethod(generate_codes))
+    return state
+
+
+def test_testing_engine_shares_one_in_memory_connection(modular_app):
+    # Engine options come from TestingConfig; config.update() after create_app is too late
+    with modular_app.app_context():
+        assert isinstance(db.engine.pool, StaticPool)
+        assert db.engine.url.database == ':memory:'
+
+
 def login_session(client, remember: bool | None = None) -> None:
     with client.session_transaction() as sess:
         sess['admin_logged_in'] = True
@@ -65,30 +101,18 @@ def test_login_redirects_when_already_logged_in(modular_client):
     assert '/admin/dashboard' in response.headers.get('Location', '')
 
 
-def test_login_success_without_remember_me(modular_client):
-    response = modular_client.post(
-        '/admin/login',
-        data={'username': 'admin', 'password': 'correct-password'},
-        follow_redirects=False,
-    )
-
-    assert response.status_code == 302
-    with modular_client.session_transaction() as sess:
-        assert sess.get('admin_logged_in') is True
-        assert 'remember_me' not in sess
+@pytest.mark.parametrize('remember', [False, True], ids=['session', 'remember-me'])
+def test_login_success(modular_client, remember):
+    data = {'username': 'admin', 'password': 'correct-password'}
+    if remember:
+        data['remember'] = 'on'
 
-
-def test_login_success_with_remember_me(modular_client):
-    response = modular_client.post(
-        '/admin/login',
-        data={'username': 'admin', 'password': 'correct-password', 'remember': 'on'},
-        follow_redirects=False,
-    )
+    response = modular_client.post('/admin/login', data=data, follow_redirects=False)
 
     assert response.status_code == 302
     with modular_client.session_transaction() as sess:
         assert sess.get('admin_logged_in') is True
-        assert sess.get('remember_me') is True
+        assert sess.get('remember_me') is (True if remember else None)
 
 
 def test_login_fails_with_invalid_credentials(modular_client):
@@ -133,30 +157,20 @@ def test_forgot_password_get_and_missing_new_password_branch(modular_client):
     assert post_response.status_code == 200
 
 
-def test_forgot_password_valid_recovery_code_path(modular_client, monkeypatch):
-    calls = {'remaining': 0}
-
-    def fake_verify_and_use(code):
-        return code == 'VALID-CODE'
-
-    def fake_remaining_count():
-        calls['remaining'] += 1
-        return 3 if calls['remaining'] == 1 else 2
-
-    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'verify_and_use', staticmethod(fake_verify_and_use))
-    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'get_remaining_count', staticmethod(fake_remaining_count))
+def test_forgot_password_valid_recovery_code_path(modular_client, recovery_stub, fast_route_hash):
+    recovery_stub.remaining = 3
 
     response = modular_client.post(
         '/admin/forgot-password',
-        data={'recovery_code': 'VALID-CODE', 'new_password': 'new-pass-123'},
+        data={'recovery_code': recovery_stub.valid_code, 'new_password': 'new-pass-123'},
     )
 
     assert response.status_code == 200
+    assert recovery_stub.remaining == 2
 
 
-def test_forgot_password_invalid_recovery_code_path(modular_client, monkeypatch):
-    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'verify_and_use', staticmethod(lambda _code: False))
-    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'get_remaining_count', staticmethod(lambda: 5))
+def test_forgot_password_invalid_recovery_code_path(modular_client, recovery_stub):
+    recovery_stub.remaining = 5
 
     response = modular_client.post(
         '/admin/forgot-password',
@@ -164,17 +178,18 @@ def test_forgot_password_invalid_recovery_code_path(modular_client, monkeypatch)
     )
 
     assert response.status_code == 200
+    assert recovery_stub.remaining == 5
 
 
-def test_forgot_password_legacy_fallback_paths(modular_client, monkeypatch):
-    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'get_remaining_count', staticmethod(lambda: 0))
+def test_forgot_password_legacy_fallback_paths(modular_client, recovery_stub, fast_route_hash):
+    recovery_stub.remaining = 0
     no_codes_response = modular_client.post(
         '/admin/forgot-password',
         data={'new_password': 'legacy-pass-1'},
     )
     assert no_codes_response.status_code == 200
 
-    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'get_remaining_count', staticmethod(lambda: 4))
+    recovery_stub.remaining = 4
     with_codes_response = modular_client.post(
         '/admin/forgot-password',
         data={'new_password': 'legacy-pass-2'},
@@ -188,13 +203,13 @@ def test_security_settings_requires_authentication(modular_client):
     assert '/admin/login' in response.headers.get('Location', '')
 
 
-def test_security_settings_get_and_generate_codes(modular_client, monkeypatch):
+def test_security_settings_get_and_generate_codes(modular_client, recovery_stub):
     login_session(modular_client)
 
-    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'get_remaining_count', staticmethod(lambda: 1))
+    recovery_stub.remaining = 1
     get_response = modular_client.get('/admin/security')
     assert get_response.status_code == 200
 
-    monkeypatch.setattr(auth_routes.AdminRecoveryCode, 'generate_codes', staticmethod(lambda _count: ['A', 'B']))
     post_response = modular_client.post('/admin/security', data={'action': 'generate_codes'})
     assert post_response.status_code == 200
+    assert recovery_stub.remaining == 10
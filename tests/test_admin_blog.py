@@ -1,37 +1,42 @@
 """
 Tests for admin blog management routes.
 """
+import pytest
+from sqlalchemy import func, select
+
 from app.models import db, BlogPost
 
 
+@pytest.mark.parametrize('method,path', [
+    ('get', '/admin/blog'),
+    ('get', '/admin/blog/create'),
+    ('get', '/admin/blog/edit/1'),
+    ('post', '/admin/blog/delete/1'),
+])
+def test_admin_blog_routes_require_auth(client, method, path):
+    """Blog admin routes should reject unauthenticated requests before touching the DB."""
+    response = getattr(client, method)(path)
+    assert response.status_code in [302, 401, 403]
+
+
 class TestBlogList:
     """Test blog post listing page."""
     
-    def test_blog_list_requires_auth(self, client, database):
-        """Blog list page should require authentication."""
-        response = client.get('/admin/blog')
-        assert response.status_code in [302, 401, 403]
-    
     def test_blog_list_loads_with_auth(self, auth_client, database):
         """Blog list page should load with authentication."""
         response = auth_client.get('/admin/blog')
         assert response.status_code == 200
     
-    def test_blog_list_shows_posts(self, auth_client, database):
+    def test_blog_list_shows_posts(self, auth_client, database, sample_blog_post):
         """Blog list should display existing blog posts."""
-        # Test data is already created by database fixture
         response = auth_client.get('/admin/blog')
         assert response.status_code == 200
+        assert db.session.get(BlogPost, sample_blog_post).title.encode() in response.data
 
 
 class TestCreateBlogPost:
     """Test blog post creation."""
     
-    def test_create_blog_get_requires_auth(self, client, database):
-        """Create blog GET should require authentication."""
-        response = client.get('/admin/blog/create')
-        assert response.status_code in [302, 401, 403]
-    
     def test_create_blog_get_loads_form(self, auth_client, database):
         """Create blog GET should load form."""
         response = auth_client.get('/admin/blog/create')
@@ -50,14 +55,17 @@ class TestCreateBlogPost:
             'published': 'on'
         }
         
-        response = auth_client.post('/admin/blog/create', data=data, follow_redirects=True)
-        assert response.status_code == 200
+        response = auth_client.post('/admin/blog/create', data=data)
+        assert response.status_code == 302
+        assert '/admin/blog' in response.location
         
         # Verify post was created
-        post = BlogPost.query.filter_by(title='New Blog Post').first()
-        assert post is not None
-        assert post.slug == 'new-blog-post'
-        assert post.published is True
+        row = db.session.execute(
+            select(BlogPost.slug, BlogPost.published).where(BlogPost.title == 'New Blog Post')
+        ).first()
+        assert row is not None
+        assert row.slug == 'new-blog-post'
+        assert row.published is True
     
     def test_create_blog_auto_generates_slug(self, auth_client, database):
         """Should auto-generate slug from title."""
@@ -69,27 +77,22 @@ class TestCreateBlogPost:
         
         auth_client.post('/admin/blog/create', data=data)
         
-        post = BlogPost.query.filter_by(title='Test Blog Post With Spaces').first()
-        assert post is not None
-        assert post.slug == 'test-blog-post-with-spaces'
+        slug = db.session.scalar(
+            select(BlogPost.slug).where(BlogPost.title == 'Test Blog Post With Spaces'))
+        assert slug == 'test-blog-post-with-spaces'
 
 
 class TestEditBlogPost:
     """Test blog post editing."""
     
-    def test_edit_blog_get_loads_form(self, auth_client, database):
+    def test_edit_blog_get_loads_form(self, auth_client, database, sample_blog_post):
         """Edit blog GET should load form with post data."""
-        # Use existing test post from fixture
-        post = BlogPost.query.first()
-        assert post is not None
-        
-        response = auth_client.get(f'/admin/blog/edit/{post.id}')
+        response = auth_client.get(f'/admin/blog/edit/{sample_blog_post}')
         assert response.status_code == 200
     
-    def test_edit_blog_post_updates_fields(self, auth_client, database):
+    def test_edit_blog_post_updates_fields(self, auth_client, database, sample_blog_post):
         """Should update blog post fields."""
-        post = BlogPost.query.first()
-        post_id = post.id
+        post_id = sample_blog_post
         
         data = {
             'title': 'Updated Title',
@@ -100,12 +103,12 @@ class TestEditBlogPost:
             'category': 'Updated Category'
         }
         
-        response = auth_client.post(f'/admin/blog/edit/{post_id}', data=data, follow_redirects=True)
-        assert response.status_code == 200
+        response = auth_client.post(f'/admin/blog/edit/{post_id}', data=data)
+        assert response.status_code == 302
         
         # Verify updates
-        updated_post = BlogPost.query.get(post_id)
-        assert updated_post.title == 'Updated Title'
+        title = db.session.scalar(select(BlogPost.title).where(BlogPost.id == post_id))
+        assert title == 'Updated Title'
 
 
 class TestDeleteBlogPost:
@@ -123,9 +126,10 @@ class TestDeleteBlogPost:
         db.session.commit()
         post_id = post.id
         
-        response = auth_client.post(f'/admin/blog/delete/{post_id}', follow_redirects=True)
-        assert response.status_code == 200
+        response = auth_client.post(f'/admin/blog/delete/{post_id}')
+        assert response.status_code == 302
         
         # Verify deletion
-        deleted_post = BlogPost.query.get(post_id)
-        assert deleted_post is None
+        remaining = db.session.scalar(
+            select(func.count()).select_from(BlogPost).where(BlogPost.id == post_id))
+        assert remaining == 0
@@ -1,6 +1,8 @@
 """
 Additional tests for admin blog POST operations.
 """
+from sqlalchemy import select
+
 from app.models import db, BlogPost
 
 
@@ -17,11 +19,11 @@ class TestBlogCreate:
             'tags': 'python,testing',
             'category': 'tutorial',
             'published': 'on'
-        }, follow_redirects=True)
+        })
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         # Verify post was created
-        post = BlogPost.query.filter_by(title='New Test Blog Post').first()
+        post = db.session.scalar(select(BlogPost).filter_by(title='New Test Blog Post'))
         assert post is not None
         assert post.content == 'This is test content for the blog post.'
         assert post.published is True
@@ -33,9 +35,9 @@ class TestBlogCreate:
             'content': 'Content here',
             'author': 'Test Author',
             'published': 'on'
-        }, follow_redirects=True)
+        })
         
-        post = BlogPost.query.filter_by(title='Test Blog Post Title').first()
+        post = db.session.scalar(select(BlogPost).filter_by(title='Test Blog Post Title'))
         assert post is not None
         assert post.slug == 'test-blog-post-title'
     
@@ -57,7 +59,9 @@ class TestBlogCreate:
             'published': 'on'
         })
         
-        posts = BlogPost.query.filter(BlogPost.slug.like('duplicate-title%')).all()
+        posts = db.session.scalars(
+            select(BlogPost).where(BlogPost.slug.like('duplicate-title%')).order_by(BlogPost.id)
+        ).all()
         assert len(posts) == 2
         assert posts[0].slug == 'duplicate-title'
         assert posts[1].slug == 'duplicate-title-1'
@@ -73,7 +77,7 @@ class TestBlogCreate:
             'published': 'on'
         })
         
-        post = BlogPost.query.filter_by(title='Read Time Test').first()
+        post = db.session.scalar(select(BlogPost).filter_by(title='Read Time Test'))
         assert post.read_time == '1 min'
     
     def test_create_blog_post_unpublished(self, auth_client, database):
@@ -84,9 +88,9 @@ class TestBlogCreate:
             'author': 'Test Author',
             'published_present': '1'
             # No 'published' checkbox checked
-        }, follow_redirects=True)
+        })
         
-        post = BlogPost.query.filter_by(title='Draft Post').first()
+        post = db.session.scalar(select(BlogPost).filter_by(title='Draft Post'))
         assert post is not None
         assert post.published is False
 
@@ -115,9 +119,9 @@ class TestBlogUpdate:
             'excerpt': 'New excerpt',
             'author': 'Test Author',
             'published': 'on'
-        }, follow_redirects=True)
+        })
         
-        updated_post = BlogPost.query.get(post_id)
+        updated_post = db.session.get(BlogPost, post_id)
         assert updated_post.title == 'Updated Title'
         assert updated_post.content == 'Updated content'
     
@@ -141,7 +145,7 @@ class TestBlogUpdate:
             'published': 'on'
         })
         
-        updated_post = BlogPost.query.get(post_id)
+        updated_post = db.session.get(BlogPost, post_id)
         assert updated_post.slug == 'brand-new-title'
     
     def test_update_blog_post_to_unpublished(self, auth_client, database):
@@ -165,7 +169,7 @@ class TestBlogUpdate:
             # No 'published' checkbox
         })
         
-        updated_post = BlogPost.query.get(post_id)
+        updated_post = db.session.get(BlogPost, post_id)
         assert updated_post.published is False
 
 
@@ -185,17 +189,17 @@ class TestBlogDelete:
         db.session.commit()
         post_id = post.id
         
-        response = auth_client.post(f'/admin/blog/delete/{post_id}', follow_redirects=True)
+        response = auth_client.post(f'/admin/blog/delete/{post_id}')
         
-        assert response.status_code == 200
-        deleted_post = BlogPost.query.get(post_id)
+        assert response.status_code == 302
+        deleted_post = db.session.get(BlogPost, post_id)
         assert deleted_post is None
     
     def test_delete_nonexistent_blog_post(self, auth_client, database):
         """Should handle deleting nonexistent post."""
-        response = auth_client.post('/admin/blog/delete/99999', follow_redirects=True)
+        response = auth_client.post('/admin/blog/delete/99999')
         # Should redirect or show error, not crash
-        assert response.status_code in [200, 404]
+        assert response.status_code in [302, 404]
 
 
 class TestBlogFormValidation:
@@ -208,8 +212,8 @@ class TestBlogFormValidation:
             'content': '',
             'author': 'Test Author',
             'published': 'on'
-        }, follow_redirects=True)
+        })
         
-        assert response.status_code == 200
-        post = BlogPost.query.filter_by(title='Title Only Post').first()
+        assert response.status_code == 302
+        post = db.session.scalar(select(BlogPost).filter_by(title='Title Only Post'))
         assert post is not None
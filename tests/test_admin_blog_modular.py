@@ -12,29 +12,29 @@ from app.app_factory import create_app
 from app.models import BlogPost, db
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def modular_app():
     app = create_app('testing')
     app.config.update(
         TESTING=True,
-        SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
         WTF_CSRF_ENABLED=False,
         SECRET_KEY='test-secret-key',
     )
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
+    return app
 
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
+
+@pytest.fixture
+def modular_client(modular_app, modular_database):
+    return modular_app.test_client()
 
 
 @pytest.fixture
-def modular_client(modular_app):
+def readonly_client(modular_app):
+    """Client for tests that never write, so they skip the rollback wrapper."""
     return modular_app.test_client()
 
 
@@ -51,6 +51,7 @@ def create_post(
     author: str = 'Admin',
     published: bool = True,
     image_url: str = '/static/images/original.jpg',
+    commit: bool = True,
 ) -> BlogPost:
     post = BlogPost(
         title=title,
@@ -62,12 +63,13 @@ def create_post(
         read_time='1 min',
     )
     db.session.add(post)
-    db.session.commit()
+    if commit:
+        db.session.commit()
     return post
 
 
-def test_blog_list_requires_authentication(modular_client):
-    response = modular_client.get('/admin/blog', follow_redirects=False)
+def test_blog_list_requires_authentication(readonly_client):
+    response = readonly_client.get('/admin/blog', follow_redirects=False)
     assert response.status_code == 302
     assert '/admin/login' in response.headers.get('Location', '')
 
@@ -83,9 +85,9 @@ def test_blog_list_renders_for_authenticated_admin(modular_client, modular_app):
     assert b'Alpha' in response.data
 
 
-def test_create_blog_get_renders_form(modular_client):
-    login_session(modular_client)
-    response = modular_client.get('/admin/blog/create')
+def test_create_blog_get_renders_form(readonly_client):
+    login_session(readonly_client)
+    response = readonly_client.get('/admin/blog/create')
     assert response.status_code == 200
 
 
@@ -139,8 +141,9 @@ def test_create_blog_post_resolves_duplicate_slugs_with_counter_loop(modular_cli
     login_session(modular_client)
 
     with modular_app.app_context():
-        create_post(title='Existing', slug='duplicate-title')
-        create_post(title='Existing 2', slug='duplicate-title-1')
+        create_post(title='Existing', slug='duplicate-title', commit=False)
+        create_post(title='Existing 2', slug='duplicate-title-1', commit=False)
+        db.session.commit()
 
     response = modular_client.post(
         '/admin/blog/create',
@@ -159,9 +162,9 @@ def test_create_blog_post_resolves_duplicate_slugs_with_counter_loop(modular_cli
         assert post.slug == 'duplicate-title-2'
 
 
-def test_edit_blog_get_404_for_missing_post(modular_client):
-    login_session(modular_client)
-    response = modular_client.get('/admin/blog/edit/999999')
+def test_edit_blog_get_404_for_missing_post(readonly_client):
+    login_session(readonly_client)
+    response = readonly_client.get('/admin/blog/edit/999999')
     assert response.status_code == 404
 
 
@@ -181,9 +184,10 @@ def test_edit_blog_post_updates_fields_and_unique_slug(modular_client, modular_a
     login_session(modular_client)
 
     with modular_app.app_context():
-        target = create_post(title='Target', slug='target-slug', content='old content')
-        create_post(title='Conflict A', slug='new-slug')
-        create_post(title='Conflict B', slug='new-slug-1')
+        target = create_post(title='Target', slug='target-slug', content='old content', commit=False)
+        create_post(title='Conflict A', slug='new-slug', commit=False)
+        create_post(title='Conflict B', slug='new-slug-1', commit=False)
+        db.session.commit()
         target_id = target.id
 
     response = modular_client.post(
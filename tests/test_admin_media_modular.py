@@ -9,38 +9,39 @@ from __future__ import annotations
 from io import BytesIO
 
 import pytest
+from werkzeug.datastructures import FileStorage
+from werkzeug.test import encode_multipart
 
 from app.app_factory import create_app
 from app.models import db
 from app.routes.admin import media as media_routes
 
 
-@pytest.fixture
-def modular_app(tmp_path):
+@pytest.fixture(scope='session')
+def modular_app():
     app = create_app('testing')
     app.config.update(
         TESTING=True,
-        SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
         WTF_CSRF_ENABLED=False,
         SECRET_KEY='test-secret-key',
-        UPLOAD_FOLDER=str(tmp_path / 'uploads'),
         UPLOAD_URL_PREFIX='/uploads',
         ALLOWED_EXTENSIONS={'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg'},
     )
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
+    return app
 
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
+
+@pytest.fixture(autouse=True)
+def _upload_folder(modular_app, tmp_path, monkeypatch):
+    monkeypatch.setitem(modular_app.config, 'UPLOAD_FOLDER', str(tmp_path / 'uploads'))
 
 
 @pytest.fixture
 def modular_client(modular_app):
+    # Media routes only touch the filesystem, so no database rollback is needed
     return modular_app.test_client()
 
 
@@ -49,6 +50,21 @@ def login_admin(client) -> None:
         sess['admin_logged_in'] = True
 
 
+def image_upload(payload: bytes, filename: str) -> dict:
+    """Encode a one-file multipart body; returns client.post keyword arguments."""
+    boundary, body = encode_multipart({'image': FileStorage(BytesIO(payload), filename=filename)})
+    return {
+        'data': body,
+        'content_type': f'multipart/form-data; boundary={boundary}',
+    }
+
+
+@pytest.fixture(scope='module')
+def safe_png_upload():
+    """One pre-encoded valid upload shared by tests that only vary the route's collaborators."""
+    return image_upload(b'payload', 'safe.png')
+
+
 def test_upload_image_requires_authentication(modular_client):
     response = modular_client.get('/admin/upload-image', follow_redirects=False)
     assert response.status_code == 302
@@ -76,15 +92,14 @@ def test_upload_image_post_empty_filename_returns_400(modular_client):
 
     response = modular_client.post(
         '/admin/upload-image',
-        data={'image': (BytesIO(b'abc'), '')},
-        content_type='multipart/form-data',
+        **image_upload(b'abc', ''),
     )
 
     assert response.status_code == 400
     assert b'Upload Image' in response.data
 
 
-def test_upload_image_post_validation_failure_returns_400(modular_client, monkeypatch):
+def test_upload_image_post_validation_failure_returns_400(modular_client, monkeypatch, safe_png_upload):
     login_admin(modular_client)
 
     monkeypatch.setattr(
@@ -95,8 +110,7 @@ def test_upload_image_post_validation_failure_returns_400(modular_client, monkey
 
     response = modular_client.post(
         '/admin/upload-image',
-        data={'image': (BytesIO(b'not-image'), 'bad.png')},
-        content_type='multipart/form-data',
+        **safe_png_upload,
     )
 
     assert response.status_code == 400
@@ -114,15 +128,14 @@ def test_upload_image_post_invalid_secure_filename_returns_400(modular_client, m
 
     response = modular_client.post(
         '/admin/upload-image',
-        data={'image': (BytesIO(b'payload'), '..')},
-        content_type='multipart/form-data',
+        **image_upload(b'payload', '..'),
     )
 
     assert response.status_code == 400
     assert b'Upload Image' in response.data
 
 
-def test_upload_image_post_path_resolution_error_returns_400(modular_client, monkeypatch):
+def test_upload_image_post_path_resolution_error_returns_400(modular_client, monkeypatch, safe_png_upload):
     login_admin(modular_client)
 
     monkeypatch.setattr(
@@ -138,15 +151,14 @@ def test_upload_image_post_path_resolution_error_returns_400(modular_client, mon
 
     response = modular_client.post(
         '/admin/upload-image',
-        data={'image': (BytesIO(b'payload'), 'safe.png')},
-        content_type='multipart/form-data',
+        **safe_png_upload,
     )
 
     assert response.status_code == 400
     assert b'Upload Image' in response.data
 
 
-def test_upload_image_post_success_saves_file_and_renders_uploaded_path(modular_client, modular_app, monkeypatch, tmp_path):
+def test_upload_image_post_success_saves_file_and_renders_uploaded_path(modular_client, monkeypatch, tmp_path, safe_png_upload):
     login_admin(modular_client)
 
     monkeypatch.setattr(
@@ -157,16 +169,15 @@ def test_upload_image_post_success_saves_file_and_renders_uploaded_path(modular_
 
     response = modular_client.post(
         '/admin/upload-image',
-        data={'image': (BytesIO(b'valid-image-bytes'), 'hero.png')},
-        content_type='multipart/form-data',
+        **safe_png_upload,
     )
 
     assert response.status_code == 200
-    assert b'/uploads/hero_' in response.data
+    assert b'/uploads/safe_' in response.data
     assert b'.png' in response.data
 
     upload_dir = tmp_path / 'uploads'
     saved = list(upload_dir.iterdir())
     assert len(saved) == 1
-    assert saved[0].name.startswith('hero_')
+    assert saved[0].name.startswith('safe_')
     assert saved[0].suffix == '.png'
@@ -9,34 +9,35 @@ from __future__ import annotations
 import json
 
 import pytest
+from sqlalchemy import insert, select
 
 from app.app_factory import create_app
 from app.models import Product, db
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def modular_app():
     app = create_app('testing')
     app.config.update(
         TESTING=True,
-        SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
         WTF_CSRF_ENABLED=False,
         SECRET_KEY='test-secret-key',
     )
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
+    return app
 
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
+
+@pytest.fixture
+def modular_client(modular_app, modular_database):
+    return modular_app.test_client()
 
 
 @pytest.fixture
-def modular_client(modular_app):
+def readonly_client(modular_app):
+    """Client for tests that never write, so they skip the rollback wrapper."""
     return modular_app.test_client()
 
 
@@ -45,9 +46,16 @@ def login_admin(client) -> None:
         sess['admin_logged_in'] = True
 
 
-def test_products_routes_require_authentication(modular_client):
-    list_resp = modular_client.get('/admin/products', follow_redirects=False)
-    add_resp = modular_client.get('/admin/products/add', follow_redirects=False)
+def seed_products(rows: list[dict]) -> list[int]:
+    """Insert product rows in one executemany round trip and return their ids."""
+    ids = db.session.scalars(insert(Product).returning(Product.id), rows).all()
+    db.session.commit()
+    return ids
+
+
+def test_products_routes_require_authentication(readonly_client):
+    list_resp = readonly_client.get('/admin/products', follow_redirects=False)
+    add_resp = readonly_client.get('/admin/products/add', follow_redirects=False)
 
     assert list_resp.status_code == 302
     assert add_resp.status_code == 302
@@ -58,26 +66,23 @@ def test_products_list_renders(modular_client, modular_app):
     login_admin(modular_client)
 
     with modular_app.app_context():
-        db.session.add(
-            Product(
-                name='Coverage Product',
-                description='Product description',
-                price=29.99,
-                type='digital',
-                category='software',
-            )
-        )
-        db.session.commit()
+        seed_products([{
+            'name': 'Coverage Product',
+            'description': 'Product description',
+            'price': 29.99,
+            'type': 'digital',
+            'category': 'software',
+        }])
 
     response = modular_client.get('/admin/products')
     assert response.status_code == 200
     assert b'Coverage Product' in response.data
 
 
-def test_add_product_get_renders_form(modular_client):
-    login_admin(modular_client)
+def test_add_product_get_renders_form(readonly_client):
+    login_admin(readonly_client)
 
-    response = modular_client.get('/admin/products/add')
+    response = readonly_client.get('/admin/products/add')
     assert response.status_code == 200
     assert b'Add Product' in response.data or b'Create Product' in response.data
 
@@ -106,7 +111,7 @@ def test_add_product_success_creates_record(modular_client, modular_app):
     assert '/admin/products' in response.headers.get('Location', '')
 
     with modular_app.app_context():
-        product = Product.query.filter_by(name='New Product').first()
+        product = db.session.scalar(select(Product).filter_by(name='New Product'))
         assert product is not None
         assert product.price == 49.50
         assert json.loads(product.features_json) == ['Feature 1', 'Feature 2']
@@ -132,10 +137,10 @@ def test_add_product_invalid_price_returns_form(modular_client, modular_app):
     assert b'Product Form' in response.data or b'Add Product' in response.data
 
     with modular_app.app_context():
-        assert Product.query.filter_by(name='Bad Product').first() is None
+        assert db.session.scalar(select(Product).filter_by(name='Bad Product')) is None
 
 
-def test_add_product_generic_exception_rolls_back(modular_client, modular_app, monkeypatch):
+def test_add_product_generic_exception_rolls_back(modular_client, monkeypatch):
     login_admin(modular_client)
 
     def raise_add_error(_obj):
@@ -162,19 +167,16 @@ def test_edit_product_get_and_post_update_fields(modular_client, modular_app):
     login_admin(modular_client)
 
     with modular_app.app_context():
-        product = Product(
-            name='Editable Product',
-            description='Before edit',
-            price=20.0,
-            type='digital',
-            category='tools',
-            features_json='["Old"]',
-            image_url='/static/images/old.jpg',
-            available=True,
-        )
-        db.session.add(product)
-        db.session.commit()
-        product_id = product.id
+        [product_id] = seed_products([{
+            'name': 'Editable Product',
+            'description': 'Before edit',
+            'price': 20.0,
+            'type': 'digital',
+            'category': 'tools',
+            'features_json': '["Old"]',
+            'image_url': '/static/images/old.jpg',
+            'available': True,
+        }])
 
     get_response = modular_client.get(f'/admin/products/edit/{product_id}')
     assert get_response.status_code == 200
@@ -199,7 +201,7 @@ def test_edit_product_get_and_post_update_fields(modular_client, modular_app):
     assert post_response.status_code == 302
 
     with modular_app.app_context():
-        product = Product.query.get(product_id)
+        product = db.session.get(Product, product_id)
         assert product is not None
         assert product.name == 'Edited Product'
         assert product.price == 99.99
@@ -210,11 +212,11 @@ def test_edit_product_get_and_post_update_fields(modular_client, modular_app):
         assert product.available is False
 
 
-def test_edit_and_delete_unknown_product_return_404(modular_client):
-    login_admin(modular_client)
+def test_edit_and_delete_unknown_product_return_404(readonly_client):
+    login_admin(readonly_client)
 
-    edit_response = modular_client.get('/admin/products/edit/99999')
-    delete_response = modular_client.post('/admin/products/delete/99999')
+    edit_response = readonly_client.get('/admin/products/edit/99999')
+    delete_response = readonly_client.post('/admin/products/delete/99999')
 
     assert edit_response.status_code == 404
     assert delete_response.status_code == 404
@@ -224,19 +226,16 @@ def test_delete_product_success(modular_client, modular_app):
     login_admin(modular_client)
 
     with modular_app.app_context():
-        product = Product(
-            name='Delete Product',
-            description='Delete me',
-            price=15.0,
-            type='digital',
-            category='tools',
-        )
-        db.session.add(product)
-        db.session.commit()
-        product_id = product.id
+        [product_id] = seed_products([{
+            'name': 'Delete Product',
+            'description': 'Delete me',
+            'price': 15.0,
+            'type': 'digital',
+            'category': 'tools',
+        }])
 
     response = modular_client.post(f'/admin/products/delete/{product_id}', follow_redirects=False)
     assert response.status_code == 302
 
     with modular_app.app_context():
-        assert Product.query.get(product_id) is None
+        assert db.session.get(Product, product_id) is None
@@ -3,17 +3,27 @@ Tests for admin projects and Raspberry Pi management routes.
 """
 import json
 from unittest.mock import patch
+
+import pytest
+
 from app.models import db, Project, RaspberryPiProject
 
 
+@pytest.mark.parametrize('path', [
+    '/admin/projects',
+    '/admin/projects/add',
+    '/admin/raspberry-pi',
+    '/admin/raspberry-pi/add',
+])
+def test_admin_project_routes_require_auth(client, path):
+    """Project admin pages should reject unauthenticated requests."""
+    response = client.get(path)
+    assert response.status_code in [302, 401, 403]
+
+
 class TestProjectsList:
     """Test projects listing page."""
     
-    def test_projects_list_requires_auth(self, client, database):
-        """Projects list should require authentication."""
-        response = client.get('/admin/projects')
-        assert response.status_code in [302, 401, 403]
-    
     def test_projects_list_loads(self, auth_client, database):
         """Projects list should load with authentication."""
         response = auth_client.get('/admin/projects')
@@ -23,11 +33,6 @@ class TestProjectsList:
 class TestAddProject:
     """Test project creation."""
     
-    def test_add_project_get_requires_auth(self, client, database):
-        """Add project GET should require authentication."""
-        response = client.get('/admin/projects/add')
-        assert response.status_code in [302, 401, 403]
-    
     def test_add_project_get_loads_form(self, auth_client, database):
         """Add project GET should load form."""
         response = auth_client.get('/admin/projects/add')
@@ -43,8 +48,9 @@ class TestAddProject:
             'featured': 'on'
         }
         
-        response = auth_client.post('/admin/projects/add', data=data, follow_redirects=True)
-        assert response.status_code == 200
+        response = auth_client.post('/admin/projects/add', data=data)
+        assert response.status_code == 302
+        assert '/admin/projects' in response.headers['Location']
         
         # Verify project was created
         project = Project.query.filter_by(title='New Project').first()
@@ -79,8 +85,9 @@ class TestDeleteProject:
         db.session.commit()
         project_id = project.id
         
-        response = auth_client.post(f'/admin/projects/delete/{project_id}', follow_redirects=True)
-        assert response.status_code == 200
+        response = auth_client.post(f'/admin/projects/delete/{project_id}')
+        assert response.status_code == 302
+        assert '/admin/projects' in response.headers['Location']
         
         # Verify deletion
         deleted = Project.query.get(project_id)
@@ -90,11 +97,6 @@ class TestDeleteProject:
 class TestRaspberryPiList:
     """Test Raspberry Pi projects listing."""
     
-    def test_raspberry_pi_list_requires_auth(self, client, database):
-        """Raspberry Pi list should require authentication."""
-        response = client.get('/admin/raspberry-pi')
-        assert response.status_code in [302, 401, 403]
-    
     def test_raspberry_pi_list_loads(self, auth_client, database):
         """Raspberry Pi list should load."""
         response = auth_client.get('/admin/raspberry-pi')
@@ -104,11 +106,6 @@ class TestRaspberryPiList:
 class TestAddRaspberryPiProject:
     """Test Raspberry Pi project creation."""
     
-    def test_add_rpi_get_requires_auth(self, client, database):
-        """Add RPi project GET should require authentication."""
-        response = client.get('/admin/raspberry-pi/add')
-        assert response.status_code in [302, 401, 403]
-    
     def test_add_rpi_get_loads_form(self, auth_client, database):
         """Add RPi project GET should load form."""
         response = auth_client.get('/admin/raspberry-pi/add')
@@ -127,8 +124,9 @@ class TestAddRaspberryPiProject:
             'features': 'Motion detection'
         }
         
-        response = auth_client.post('/admin/raspberry-pi/add', data=data, follow_redirects=True)
-        assert response.status_code == 200
+        response = auth_client.post('/admin/raspberry-pi/add', data=data)
+        assert response.status_code == 302
+        assert '/admin/raspberry-pi' in response.headers['Location']
         
         # Verify project was created
         project = RaspberryPiProject.query.filter_by(title='New RPi Project').first()
@@ -151,8 +149,9 @@ class TestDeleteRaspberryPiProject:
         db.session.commit()
         project_id = project.id
         
-        response = auth_client.post(f'/admin/raspberry-pi/delete/{project_id}', follow_redirects=True)
-        assert response.status_code == 200
+        response = auth_client.post(f'/admin/raspberry-pi/delete/{project_id}')
+        assert response.status_code == 302
+        assert '/admin/raspberry-pi' in response.headers['Location']
         
         # Verify deletion
         deleted = RaspberryPiProject.query.get(project_id)
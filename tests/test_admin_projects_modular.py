@@ -9,34 +9,123 @@ from __future__ import annotations
 import json
 
 import pytest
+from sqlalchemy import insert
+from werkzeug.datastructures import ImmutableMultiDict
 
 from app.app_factory import create_app
 from app.models import db, Product, Project, RaspberryPiProject
-
-
-@pytest.fixture
+from app.routes.admin import projects as projects_module
+
+# Primary keys pinned by seed_data
+COVERAGE_PROJECT_ID = 1
+EDITABLE_PROJECT_ID = 2
+EDITABLE_RPI_ID = 1
+OWN_PRODUCT_ID = 1
+
+RPI_STRUCTURED_FORM = ImmutableMultiDict({
+    'title': 'Smart Greenhouse',
+    'description': 'Automated greenhouse monitoring',
+    'hardware': 'Raspberry Pi 5, DHT22',
+    'technologies': 'Python,GPIO',
+    'features': 'Monitoring\nAlerts',
+    # No image to cover placeholder fallback branch
+    'doc_title[]': ['Setup Guide', 'Ignore Missing URL'],
+    'doc_url[]': ['https://docs.example.com/setup', ''],
+    'doc_type[]': ['github', 'markdown'],
+    'diagram_title[]': ['Wiring Diagram'],
+    'diagram_url[]': ['https://example.com/wiring.png'],
+    'diagram_type[]': ['image'],
+    'part_name[]': ['Camera Module', 'Custom Board', 'USB Cable'],
+    'part_url[]': ['https://shop.example/camera', '', ''],
+    'part_is_own_product[]': ['on', 'on', ''],
+    'part_product_id[]': [str(OWN_PRODUCT_ID), 'abc', ''],
+    'video_title[]': ['Valid Tutorial', 'Bad Tutorial'],
+    'video_url[]': [
+        'https://youtube.com/watch?v=valid-video',
+        'https://invalid.example/video',
+    ],
+})
+
+
+@pytest.fixture(scope='session')
 def modular_app():
     app = create_app('testing')
     app.config.update(
         TESTING=True,
-        SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
         WTF_CSRF_ENABLED=False,
         SECRET_KEY='test-secret-key',
     )
+    # No Redis here: every limited request would fail to connect and log the traceback
+    app.extensions['limiter'].enabled = False
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
+    return app
 
-    with app.app_context():
+
+@pytest.fixture(scope='session')
+def seed_data(modular_app):
+    """Insert the rows read, edited and deleted by tests once; each test's rollback restores them."""
+    with modular_app.app_context():
+        db.session.execute(insert(Project), [
+            {
+                'id': COVERAGE_PROJECT_ID,
+                'title': 'Coverage Project',
+                'description': 'Route coverage project',
+                'technologies': 'Python,Flask',
+                'category': 'web',
+            },
+            {
+                'id': EDITABLE_PROJECT_ID,
+                'title': 'Editable Project',
+                'description': 'Before edit',
+                'technologies': 'Python',
+                'category': 'web',
+                'github_url': 'https://example.com/old',
+                'demo_url': 'https://example.com/old-demo',
+                'image_url': '/static/images/old.jpg',
+                'featured': False,
+            },
+        ])
+        db.session.execute(insert(RaspberryPiProject), [
+            {
+                'id': EDITABLE_RPI_ID,
+                'title': 'Editable RPi',
+                'description': 'Before edit',
+                'hardware_json': json.dumps(['Pi 4']),
+                'technologies': 'Python',
+                'features_json': json.dumps(['Old feature']),
+                'github_url': 'https://example.com/old',
+                'image_url': '/static/images/existing-rpi.jpg',
+            },
+        ])
+        db.session.execute(insert(Product), [
+            {
+                'id': OWN_PRODUCT_ID,
+                'name': 'Own Sensor Pack',
+                'description': 'Product linked from parts list',
+                'price': 19.99,
+                'type': 'digital',
+                'category': 'hardware',
+            },
+        ])
+        db.session.commit()
         db.session.remove()
-        db.drop_all()
+
+
+@pytest.fixture(autouse=True)
+def _stub_video_validator(monkeypatch):
+    def fake_validate(url):
+        if 'valid-video' in url:
+            return True, 'https://youtube.com/embed/abc123', 'youtube', None
+        return False, None, None, 'Unsupported video URL'
+
+    monkeypatch.setattr(projects_module, 'validate_video_url', fake_validate)
 
 
 @pytest.fixture
-def modular_client(modular_app):
+def modular_client(modular_app, seed_data, modular_database):
     return modular_app.test_client()
 
 
@@ -45,35 +134,35 @@ def login_admin(client) -> None:
         sess['admin_logged_in'] = True
 
 
+@pytest.fixture(scope='session')
+def admin_session_cookie(modular_app):
+    """Sign a logged-in session cookie once and replay it in every admin test."""
+    client = modular_app.test_client()
+    login_admin(client)
+    cookie_name = modular_app.config['SESSION_COOKIE_NAME']
+    return cookie_name, client.get_cookie(cookie_name).value
+
+
+@pytest.fixture
+def admin_client(modular_client, admin_session_cookie):
+    modular_client.set_cookie(*admin_session_cookie)
+    return modular_client
+
+
 def test_projects_list_requires_authentication(modular_client):
     response = modular_client.get('/admin/projects', follow_redirects=False)
     assert response.status_code == 302
     assert '/admin/login' in response.headers.get('Location', '')
 
 
-def test_projects_list_renders_for_authenticated_admin(modular_client, modular_app):
-    login_admin(modular_client)
-
-    with modular_app.app_context():
-        db.session.add(
-            Project(
-                title='Coverage Project',
-                description='Route coverage project',
-                technologies='Python,Flask',
-                category='web',
-            )
-        )
-        db.session.commit()
-
-    response = modular_client.get('/admin/projects')
+def test_projects_list_renders_for_authenticated_admin(admin_client):
+    response = admin_client.get('/admin/projects')
     assert response.status_code == 200
     assert b'Coverage Project' in response.data
 
 
-def test_add_project_post_persists_optional_fields(modular_client, modular_app):
-    login_admin(modular_client)
-
-    response = modular_client.post(
+def test_add_project_post_persists_optional_fields(admin_client, modular_app):
+    response = admin_client.post(
         '/admin/projects/add',
         data={
             'title': 'Minimal Project',
@@ -96,26 +185,9 @@ def test_add_project_post_persists_optional_fields(modular_client, modular_app):
         assert project.featured is False
 
 
-def test_edit_project_post_updates_fields(modular_client, modular_app):
-    login_admin(modular_client)
-
-    with modular_app.app_context():
-        project = Project(
-            title='Editable Project',
-            description='Before edit',
-            technologies='Python',
-            category='web',
-            github_url='https://example.com/old',
-            demo_url='https://example.com/old-demo',
-            image_url='/static/images/old.jpg',
-            featured=False,
-        )
-        db.session.add(project)
-        db.session.commit()
-        project_id = project.id
-
-    response = modular_client.post(
-        f'/admin/projects/edit/{project_id}',
+def test_edit_project_post_updates_fields(admin_client, modular_app):
+    response = admin_client.post(
+        f'/admin/projects/edit/{EDITABLE_PROJECT_ID}',
         data={
             'title': 'Edited Project',
             'description': 'After edit',
@@ -132,7 +204,7 @@ def test_edit_project_post_updates_fields(modular_client, modular_app):
     assert response.status_code == 302
 
     with modular_app.app_context():
-        project = Project.query.get(project_id)
+        project = Project.query.get(EDITABLE_PROJECT_ID)
         assert project is not None
         assert project.title == 'Edited Project'
         assert project.category == 'backend'
@@ -141,85 +213,26 @@ def test_edit_project_post_updates_fields(modular_client, modular_app):
         assert project.featured is True
 
 
-def test_edit_project_unknown_id_returns_404(modular_client):
-    login_admin(modular_client)
-    response = modular_client.get('/admin/projects/edit/99999')
+def test_edit_project_unknown_id_returns_404(admin_client):
+    response = admin_client.get('/admin/projects/edit/99999')
     assert response.status_code == 404
 
 
-def test_delete_project_removes_record(modular_client, modular_app):
-    login_admin(modular_client)
-
-    with modular_app.app_context():
-        project = Project(
-            title='Delete Me',
-            description='To be deleted',
-            technologies='Python',
-            category='web',
-        )
-        db.session.add(project)
-        db.session.commit()
-        project_id = project.id
-
-    response = modular_client.post(
-        f'/admin/projects/delete/{project_id}',
+def test_delete_project_removes_record(admin_client, modular_app):
+    response = admin_client.post(
+        f'/admin/projects/delete/{COVERAGE_PROJECT_ID}',
         follow_redirects=False,
     )
     assert response.status_code == 302
 
     with modular_app.app_context():
-        assert Project.query.get(project_id) is None
-
-
-def test_add_rpi_project_parses_structured_form_data(modular_client, modular_app, monkeypatch):
-    login_admin(modular_client)
-
-    with modular_app.app_context():
-        product = Product(
-            name='Own Sensor Pack',
-            description='Product linked from parts list',
-            price=19.99,
-            type='digital',
-            category='hardware',
-        )
-        db.session.add(product)
-        db.session.commit()
-        product_id = product.id
-
-    from app.routes.admin import projects as projects_module
+        assert Project.query.get(COVERAGE_PROJECT_ID) is None
 
-    def fake_validate(url):
-        if 'valid-video' in url:
-            return True, 'https://youtube.com/embed/abc123', 'youtube', None
-        return False, None, None, 'Unsupported video URL'
 
-    monkeypatch.setattr(projects_module, 'validate_video_url', fake_validate)
-
-    response = modular_client.post(
+def test_add_rpi_project_parses_structured_form_data(admin_client, modular_app):
+    response = admin_client.post(
         '/admin/raspberry-pi/add',
-        data={
-            'title': 'Smart Greenhouse',
-            'description': 'Automated greenhouse monitoring',
-            'hardware': 'Raspberry Pi 5, DHT22',
-            'technologies': 'Python,GPIO',
-            'features': 'Monitoring\nAlerts',
-            # No image to cover placeholder fallback branch
-            'doc_title[]': ['Setup Guide', 'Ignore Missing URL'],
-            'doc_url[]': ['https://docs.example.com/setup', ''],
-            'doc_type[]': ['github', 'markdown'],
-            'diagram_title[]': ['Wiring Diagram'],
-            'diagram_url[]': ['https://example.com/wiring.png'],
-            'diagram_type[]': ['image'],
-            'part_name[]': ['Camera Module', 'Custom Board', 'USB Cable'],
-            'part_url[]': ['https://shop.example/camera', '', ''],
-            'part_is_own_product[]': ['on', 'on', ''],
-            'part_product_id[]': [str(product_id), 'abc', ''],
-            'video_title[]': ['Valid Tutorial', 'Bad Tutorial'],
-            'video_url[]': [
-                'https://youtube.com/watch?v=valid-video',
-                'https://invalid.example/video',
-            ],
-        },
+        data=RPI_STRUCTURED_FORM,
         follow_redirects=False,
     )
 
@@ -253,7 +266,7 @@ def test_add_rpi_project_parses_structured_form_data(modular_client, modular_app
 
         parts = json.loads(project.parts_list_json)
         assert parts[0]['is_own_product'] is True
-        assert parts[0]['product_id'] == product_id
+        assert parts[0]['product_id'] == OWN_PRODUCT_ID
         assert parts[1]['is_own_product'] is True
         assert parts[1]['product_id'] is None
         assert parts[2]['is_own_product'] is False
@@ -265,33 +278,9 @@ def test_add_rpi_project_parses_structured_form_data(modular_client, modular_app
         assert videos[0]['embed_url'] == 'https://youtube.com/embed/abc123'
 
 
-def test_edit_rpi_project_preserves_image_when_blank(modular_client, modular_app, monkeypatch):
-    login_admin(modular_client)
-
-    with modular_app.app_context():
-        project = RaspberryPiProject(
-            title='Editable RPi',
-            description='Before edit',
-            hardware_json=json.dumps(['Pi 4']),
-            technologies='Python',
-            features_json=json.dumps(['Old feature']),
-            github_url='https://example.com/old',
-            image_url='/static/images/existing-rpi.jpg',
-        )
-        db.session.add(project)
-        db.session.commit()
-        project_id = project.id
-
-    from app.routes.admin import projects as projects_module
-
-    monkeypatch.setattr(
-        projects_module,
-        'validate_video_url',
-        lambda _url: (False, None, None, 'Invalid URL format'),
-    )
-
-    response = modular_client.post(
-        f'/admin/raspberry-pi/edit/{project_id}',
+def test_edit_rpi_project_preserves_image_when_blank(admin_client, modular_app):
+    response = admin_client.post(
+        f'/admin/raspberry-pi/edit/{EDITABLE_RPI_ID}',
         data={
             'title': 'Editable RPi Updated',
             'description': 'After edit',
@@ -319,7 +308,7 @@ def test_edit_rpi_project_preserves_image_when_blank(modular_client, modular_app
     assert response.status_code == 302
 
     with modular_app.app_context():
-        project = RaspberryPiProject.query.get(project_id)
+        project = RaspberryPiProject.query.get(EDITABLE_RPI_ID)
         assert project is not None
         assert project.title == 'Editable RPi Updated'
         assert project.github_url is None
@@ -330,33 +319,18 @@ def test_edit_rpi_project_preserves_image_when_blank(modular_client, modular_app
         assert json.loads(project.videos_json) == []
 
 
-def test_delete_rpi_project_removes_record(modular_client, modular_app):
-    login_admin(modular_client)
-
-    with modular_app.app_context():
-        project = RaspberryPiProject(
-            title='Delete RPi',
-            description='To be deleted',
-            hardware_json=json.dumps(['Pi']),
-            technologies='Python',
-            features_json=json.dumps(['Feature']),
-        )
-        db.session.add(project)
-        db.session.commit()
-        project_id = project.id
-
-    response = modular_client.post(
-        f'/admin/raspberry-pi/delete/{project_id}',
+def test_delete_rpi_project_removes_record(admin_client, modular_app):
+    response = admin_client.post(
+        f'/admin/raspberry-pi/delete/{EDITABLE_RPI_ID}',
         follow_redirects=False,
     )
 
     assert response.status_code == 302
 
     with modular_app.app_context():
-        assert RaspberryPiProject.query.get(project_id) is None
+        assert RaspberryPiProject.query.get(EDITABLE_RPI_ID) is None
 
 
-def test_delete_rpi_project_unknown_id_returns_404(modular_client):
-    login_admin(modular_client)
-    response = modular_client.post('/admin/raspberry-pi/delete/99999')
+def test_delete_rpi_project_unknown_id_returns_404(admin_client):
+    response = admin_client.post('/admin/raspberry-pi/delete/99999')
     assert response.status_code == 404
@@ -2,7 +2,22 @@
 Tests for admin routes and functionality.
 Tests authentication, CRUD operations, and admin dashboard.
 """
-from app.models import Product, RaspberryPiProject, BlogPost, OwnerProfile, SiteConfig
+import re
+
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.orm import load_only
+
+from app.models import db, Product, RaspberryPiProject, BlogPost, OwnerProfile
+
+# Case-insensitive body checks without lowercasing a copy of every response
+LOGIN_RE = re.compile(rb'login', re.IGNORECASE)
+PASSWORD_RE = re.compile(rb'password', re.IGNORECASE)
+INVALID_LOGIN_RE = re.compile(rb'Invalid credentials|(?i:incorrect)')
+
+# Every admin page pays for a savepoint, the analytics SiteConfig check and the
+# owner/config context processor; the view itself may add one more statement
+ADMIN_PAGE_MAX_QUERIES = 5
 
 
 class TestAdminAuthentication:
@@ -12,16 +27,18 @@ class TestAdminAuthentication:
         """Test admin login page accessible"""
         response = client.get('/admin/login')
         assert response.status_code == 200
-        assert b'login' in response.data.lower()
+        assert LOGIN_RE.search(response.data)
     
-    def test_admin_login_with_correct_password(self, client):
+    def test_admin_login_with_correct_password(self, client, database):
         """Test login with correct password"""
         response = client.post('/admin/login', data={
+            'username': 'admin',
             'password': 'admin123'  # Default password
-        }, follow_redirects=True)
+        })
         
         # Should redirect to dashboard
-        assert b'Dashboard' in response.data or response.status_code == 200
+        assert response.status_code == 302
+        assert '/admin/dashboard' in response.location
     
     def test_admin_login_with_wrong_password(self, client):
         """Test login with incorrect password"""
@@ -29,7 +46,7 @@ class TestAdminAuthentication:
             'password': 'wrongpassword'
         }, follow_redirects=True)
         
-        assert b'Invalid credentials' in response.data or b'incorrect' in response.data.lower()
+        assert INVALID_LOGIN_RE.search(response.data)
     
     def test_admin_logout(self, auth_client):
         """Test admin logout"""
@@ -56,50 +73,66 @@ class TestAdminDashboard:
         assert response.status_code == 200
         assert b'Dashboard' in response.data
     
-    def test_dashboard_shows_stats(self, auth_client, database):
+    def test_dashboard_shows_stats(self, auth_client, database, captured_templates, assert_max_queries):
         """Test dashboard displays statistics"""
-        response = auth_client.get('/admin/dashboard')
+        with assert_max_queries(ADMIN_PAGE_MAX_QUERIES) as statements:
+            response = auth_client.get('/admin/dashboard')
+        assert response.status_code == 200
+        # All counts come from one aggregate statement, not one query per model
+        count_statements = [s for s in statements if 'count(' in s.lower()]
+        assert len(count_statements) == 1
+        # Should pass counts of products, projects, blog posts to the template
+        [(template, context)] = captured_templates
+        assert template.name == 'admin/dashboard.html'
+        assert context['stats']['products'] == 2
+        assert context['stats']['blog_posts'] == 3
+
+
+class TestAdminPageRendering:
+    """Tests that admin list and form pages render for a logged-in admin"""
+
+    @pytest.mark.parametrize('url,needle', [
+        ('/admin/products/add', b'<form'),
+        ('/admin/products/edit/1', b'Test Product 1'),
+        ('/admin/raspberry-pi', b'Test RPi Project 1'),
+        ('/admin/raspberry-pi/add', b'<form'),
+        ('/admin/blog', b'Test Blog Post 1'),
+        ('/admin/blog/create', b'<form'),
+        ('/admin/blog/edit/1', b'Test Blog Post 1'),
+        ('/admin/owner-profile', b'Test Developer'),
+        ('/admin/site-config', b'Test Portfolio'),
+    ])
+    def test_admin_get_page_renders(self, auth_client, database, assert_max_queries, url, needle):
+        """Test each admin GET page loads and shows its seeded content"""
+        with assert_max_queries(ADMIN_PAGE_MAX_QUERIES):
+            response = auth_client.get(url)
+        # The login page also contains a <form>, so the status check stays
         assert response.status_code == 200
-        # Should show counts of products, projects, blog posts
-        assert b'2' in response.data  # 2 products
-        assert b'3' in response.data  # 3 blog posts
+        assert needle in response.data
 
 
 class TestProductCRUD:
     """Tests for product CRUD operations"""
     
-    def test_products_list(self, auth_client, database):
+    def test_products_list(self, auth_client, database, assert_max_queries):
         """Test products list page"""
-        response = auth_client.get('/admin/products')
+        with assert_max_queries(ADMIN_PAGE_MAX_QUERIES) as statements:
+            response = auth_client.get('/admin/products')
         assert response.status_code == 200
+        # Rendering the list must not query once per product row
+        assert len([s for s in statements if 'FROM products' in s]) == 1
         assert b'Test Product 1' in response.data
     
-    def test_add_product_page(self, auth_client, database):
-        """Test add product form loads"""
-        response = auth_client.get('/admin/products/add')
-        assert response.status_code == 200
-        assert b'<form' in response.data
-    
     def test_create_product(self, auth_client, database, sample_product_data):
         """Test creating new product"""
         response = auth_client.post('/admin/products/add', 
-                                   data=sample_product_data,
-                                   follow_redirects=True)
+                                   data=sample_product_data)
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         
         # Verify product was created
-        from app import app
-        with app.app_context():
-            product = Product.query.filter_by(name='New Product').first()
-            assert product is not None
-            assert product.price == 99.99
-    
-    def test_edit_product_page(self, auth_client, database):
-        """Test edit product form loads"""
-        response = auth_client.get('/admin/products/edit/1')
-        assert response.status_code == 200
-        assert b'Test Product 1' in response.data
+        price = db.session.scalar(select(Product.price).where(Product.name == 'New Product'))
+        assert price == 99.99
     
     def test_update_product(self, auth_client, database):
         """Test updating existing product"""
@@ -109,46 +142,28 @@ class TestProductCRUD:
             'price': 39.99,
             'type': 'digital',
             'category': 'software'
-        }, follow_redirects=True)
+        })
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         
         # Verify product was updated
-        from app import app
-        with app.app_context():
-            product = Product.query.get(1)
-            assert product.name == 'Updated Product'
-            assert product.price == 39.99
+        product = db.session.get(Product, 1, options=[load_only(Product.name, Product.price)])
+        assert product.name == 'Updated Product'
+        assert product.price == 39.99
     
     def test_delete_product(self, auth_client, database):
         """Test deleting product"""
-        response = auth_client.post('/admin/products/delete/1',
-                                   follow_redirects=True)
+        response = auth_client.post('/admin/products/delete/1')
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         
         # Verify product was deleted
-        from app import app
-        with app.app_context():
-            product = Product.query.get(1)
-            assert product is None
+        assert db.session.get(Product, 1) is None
 
 
 class TestRaspberryPiCRUD:
     """Tests for Raspberry Pi project CRUD operations"""
     
-    def test_rpi_projects_list(self, auth_client, database):
-        """Test RPi projects list page"""
-        response = auth_client.get('/admin/raspberry-pi')
-        assert response.status_code == 200
-        assert b'Test RPi Project 1' in response.data
-    
-    def test_add_rpi_project_page(self, auth_client, database):
-        """Test add RPi project form loads"""
-        response = auth_client.get('/admin/raspberry-pi/add')
-        assert response.status_code == 200
-        assert b'<form' in response.data
-    
     def test_create_rpi_project(self, auth_client, database):
         """Test creating new RPi project"""
         data = {
@@ -161,60 +176,38 @@ class TestRaspberryPiCRUD:
         }
         
         response = auth_client.post('/admin/raspberry-pi/add',
-                                   data=data,
-                                   follow_redirects=True)
+                                   data=data)
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         
         # Verify project was created
-        from app import app
-        with app.app_context():
-            project = RaspberryPiProject.query.filter_by(title='New RPi Project').first()
-            assert project is not None
+        project_id = db.session.scalar(
+            select(RaspberryPiProject.id).where(RaspberryPiProject.title == 'New RPi Project'))
+        assert project_id is not None
     
     def test_delete_rpi_project(self, auth_client, database):
         """Test deleting RPi project"""
-        response = auth_client.post('/admin/raspberry-pi/delete/1',
-                                   follow_redirects=True)
+        response = auth_client.post('/admin/raspberry-pi/delete/1')
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         
         # Verify project was deleted
-        from app import app
-        with app.app_context():
-            project = RaspberryPiProject.query.get(1)
-            assert project is None
+        assert db.session.get(RaspberryPiProject, 1) is None
 
 
 class TestBlogCRUD:
     """Tests for blog post CRUD operations"""
     
-    def test_blog_posts_list(self, auth_client, database):
-        """Test blog posts list page"""
-        response = auth_client.get('/admin/blog')
-        assert response.status_code == 200
-        assert b'Test Blog Post 1' in response.data
-    
-    def test_add_blog_post_page(self, auth_client, database):
-        """Test add blog post form loads"""
-        response = auth_client.get('/admin/blog/create')
-        assert response.status_code == 200
-        assert b'<form' in response.data
-    
     def test_create_blog_post(self, auth_client, database, sample_blog_data):
         """Test creating new blog post"""
         response = auth_client.post('/admin/blog/create',
-                                   data=sample_blog_data,
-                                   follow_redirects=True)
+                                   data=sample_blog_data)
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         
         # Verify post was created with auto-generated slug
-        from app import app
-        with app.app_context():
-            post = BlogPost.query.filter_by(title='New Blog Post').first()
-            assert post is not None
-            assert post.slug == 'new-blog-post'
+        slug = db.session.scalar(select(BlogPost.slug).where(BlogPost.title == 'New Blog Post'))
+        assert slug == 'new-blog-post'
     
     def test_blog_post_slug_auto_generation(self, auth_client, database):
         """Test automatic slug generation from title"""
@@ -227,179 +220,44 @@ class TestBlogCRUD:
         }
         
         _ = auth_client.post('/admin/blog/create',
-                                   data=data,
-                                   follow_redirects=True)
+                                   data=data)
         
         # Verify slug was auto-generated
-        from app import app
-        with app.app_context():
-            post = BlogPost.query.filter_by(title='This Is A Test Post!').first()
-            assert post is not None
-            assert post.slug == 'this-is-a-test-post'
-    
-    def test_edit_blog_post_page(self, auth_client, database):
-        """Test edit blog post form loads"""
-        response = auth_client.get('/admin/blog/edit/1')
-        assert response.status_code == 200
-        assert b'Test Blog Post 1' in response.data
-    
-    def test_update_blog_post(self, auth_client, database):
-        """Test updating existing blog post"""
-        response = auth_client.post('/admin/blog/edit/1', data={
-            'title': 'Updated Blog Post',
-            'content': 'Updated content',
-            'author': 'Test Author',
-            'category': 'Updated',
-            'published': True
-        }, follow_redirects=True)
-        
-        assert response.status_code == 200
-        
-        # Verify post was updated
-        from app import app
-        with app.app_context():
-            post = BlogPost.query.get(1)
-            assert post.title == 'Updated Blog Post'
-
-    def test_update_blog_post_preserves_publish_state_without_control(self, auth_client, database):
-        """Legacy forms that omit publish control should not silently unpublish."""
-        response = auth_client.post('/admin/blog/edit/1', data={
-            'title': 'Updated Blog Post Legacy Form',
-            'content': 'Updated content',
-            'author': 'Test Author',
-            'category': 'Updated'
-        }, follow_redirects=True)
-
-        assert response.status_code == 200
-
-        from app import app
-        with app.app_context():
-            post = BlogPost.query.get(1)
-            assert post.title == 'Updated Blog Post Legacy Form'
-            assert post.published is True
-
-    def test_update_blog_post_can_unpublish_with_control(self, auth_client, database):
-        """Published posts can be intentionally set to draft via form control."""
-        response = auth_client.post('/admin/blog/edit/1', data={
-            'title': 'Updated Blog Post Draft',
+        slug = db.session.scalar(select(BlogPost.slug).where(BlogPost.title == 'This Is A Test Post!'))
+        assert slug == 'this-is-a-test-post'
+    
+    @pytest.mark.parametrize('post_id,extra_form,title,published', [
+        pytest.param(1, {'published': True}, 'Updated Blog Post', True, id='update'),
+        # Legacy forms that omit the publish control should not silently unpublish
+        pytest.param(1, {}, 'Updated Blog Post Legacy Form', True, id='legacy-form-keeps-state'),
+        pytest.param(1, {'published_present': '1'}, 'Updated Blog Post Draft', False, id='unpublish'),
+        pytest.param(3, {'published_present': '1', 'published': '1'}, 'Draft Post Published', True,
+                     id='publish-draft'),
+    ])
+    def test_update_blog_post(self, auth_client, database, post_id, extra_form, title, published):
+        """Test updating a blog post and its publish state"""
+        response = auth_client.post(f'/admin/blog/edit/{post_id}', data={
+            'title': title,
             'content': 'Updated content',
             'author': 'Test Author',
             'category': 'Updated',
-            'published_present': '1'
-        }, follow_redirects=True)
-
-        assert response.status_code == 200
-
-        from app import app
-        with app.app_context():
-            post = BlogPost.query.get(1)
-            assert post.title == 'Updated Blog Post Draft'
-            assert post.published is False
-
-    def test_update_blog_post_can_publish_with_control(self, auth_client, database):
-        """Draft posts can be intentionally published via form control."""
-        response = auth_client.post('/admin/blog/edit/3', data={
-            'title': 'Draft Post Published',
-            'content': 'Updated content',
-            'author': 'Test Author',
-            'category': 'Updated',
-            'published_present': '1',
-            'published': '1'
-        }, follow_redirects=True)
+            **extra_form,
+        })
 
-        assert response.status_code == 200
+        assert response.status_code == 302
 
-        from app import app
-        with app.app_context():
-            post = BlogPost.query.get(3)
-            assert post.title == 'Draft Post Published'
-            assert post.published is True
+        row = db.session.execute(select(BlogPost.title, BlogPost.published).where(BlogPost.id == post_id)).one()
+        assert row.title == title
+        assert row.published is published
     
     def test_delete_blog_post(self, auth_client, database):
         """Test deleting blog post"""
-        response = auth_client.post('/admin/blog/delete/1',
-                                   follow_redirects=True)
+        response = auth_client.post('/admin/blog/delete/1')
         
-        assert response.status_code == 200
+        assert response.status_code == 302
         
         # Verify post was deleted
-        from app import app
-        with app.app_context():
-            post = BlogPost.query.get(1)
-            assert post is None
-
-
-class TestOwnerProfileManagement:
-    """Tests for owner profile management"""
-    
-    def test_owner_profile_page_loads(self, auth_client, database):
-        """Test owner profile management page"""
-        response = auth_client.get('/admin/owner-profile')
-        assert response.status_code == 200
-        assert b'Test Developer' in response.data
-    
-    def test_update_owner_profile(self, auth_client, database):
-        """Test updating owner profile"""
-        data = {
-            'name': 'Updated Developer',
-            'title': 'Lead Developer',
-            'bio': 'Updated bio',
-            'email': 'updated@example.com',
-            'years_experience': 10,
-            'projects_completed': 100,
-            'contributions': 2000,
-            'clients_served': 30,
-            'certifications': 5
-        }
-        
-        response = auth_client.post('/admin/owner-profile',
-                                   data=data,
-                                   follow_redirects=True)
-        
-        assert response.status_code == 200
-        
-        # Verify profile was updated
-        from app import app
-        with app.app_context():
-            owner = OwnerProfile.query.first()
-            assert owner.name == 'Updated Developer'
-            assert owner.years_experience == 10
-
-
-class TestSiteConfigManagement:
-    """Tests for site configuration management"""
-    
-    def test_site_config_page_loads(self, auth_client, database):
-        """Test site config management page"""
-        response = auth_client.get('/admin/site-config')
-        assert response.status_code == 200
-        assert b'Test Portfolio' in response.data
-    
-    def test_update_site_config(self, auth_client, database):
-        """Test updating site configuration"""
-        data = {
-            'site_name': 'Updated Portfolio',
-            'tagline': 'New tagline',
-            'mail_server': 'smtp.updated.com',
-            'mail_port': '587',
-            'mail_use_tls': 'on',
-            'blog_enabled': 'on',
-            'products_enabled': 'on',
-            'analytics_enabled': 'on'
-        }
-        
-        response = auth_client.post('/admin/site-config',
-                                   data=data,
-                                   follow_redirects=True)
-        
-        assert response.status_code == 200
-        
-        # Verify config was updated
-        from app import app
-        with app.app_context():
-            config = SiteConfig.query.first()
-            assert config.site_name == 'Updated Portfolio'
-            assert config.analytics_enabled is True
+        assert db.session.get(BlogPost, 1) is None
 
 
 class TestPasswordReset:
@@ -409,7 +267,7 @@ class TestPasswordReset:
         """Test password reset page accessible"""
         response = auth_client.get('/admin/forgot-password')
         assert response.status_code == 200
-        assert b'password' in response.data.lower()
+        assert PASSWORD_RE.search(response.data)
     
     def test_password_reset_displays_hash(self, auth_client, database):
         """Test password reset shows bcrypt hash"""
@@ -433,8 +291,19 @@ class TestConfigExportImport:
         assert response.content_type == 'application/json'
         
         data = response.get_json()
-        assert 'owner_profile' in data
-        assert 'site_config' in data
+        assert data['owner_profile']['name'] == 'Test Developer'
+        assert data['site_config']['site_name'] == 'Test Portfolio'
+
+    def test_export_config_without_owner_profile(self, auth_client, database):
+        """Test exporting when only the site config row exists"""
+        db.session.execute(delete(OwnerProfile))
+
+        response = auth_client.get('/admin/export-config')
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['owner_profile']['name'] is None
+        assert data['site_config']['site_name'] == 'Test Portfolio'
     
 
 
@@ -7,120 +7,141 @@ because the legacy app.py stack uses admin_routes.py instead.
 
 from __future__ import annotations
 
-import builtins
 import json
+import sys
 
 import pytest
+from sqlalchemy import select, true
 
 from app.app_factory import create_app
 from app.models import db, OwnerProfile, SiteConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def modular_app():
-    """Create a factory-based app instance with isolated in-memory DB."""
+    """Create one factory-based app and its schema for the whole session."""
     app = create_app('testing')
     app.config.update(
         TESTING=True,
-        SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
         WTF_CSRF_ENABLED=False,
         SECRET_KEY='test-secret-key',
     )
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
-
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
+    return app
 
 
 @pytest.fixture
-def modular_client(modular_app):
-    return modular_app.test_client()
-
-
-def login_admin(client) -> None:
-    """Set authenticated admin session for routes guarded by login_required."""
+def modular_client(modular_app, modular_database):
+    """Logged-in admin client whose writes are rolled back after each test."""
+    client = modular_app.test_client()
     with client.session_transaction() as sess:
         sess['admin_logged_in'] = True
+    return client
 
 
-def test_owner_profile_creates_default_when_missing(modular_client, modular_app):
-    login_admin(modular_client)
-
-    with modular_app.app_context():
-        OwnerProfile.query.delete()
-        db.session.commit()
+@pytest.fixture
+def anonymous_client(modular_app):
+    """Client without an admin session, for tests that never write."""
+    return modular_app.test_client()
 
-    response = modular_client.get('/admin/owner-profile')
-    assert response.status_code == 200
 
+# Valid owner profile form; tests override the fields they exercise
+BASE_OWNER_PAYLOAD = {
+    'name': 'Owner',
+    'title': 'Engineer',
+    'email': 'test@example.com',
+    'years_experience': '1',
+    'projects_completed': '2',
+    'contributions': '3',
+    'clients_served': '4',
+    'certifications': '5',
+    'skills_json': '[]',
+    'experience_json': '[]',
+    'expertise_json': '[]',
+}
+
+# Full export-shaped document accepted by /admin/import-config
+IMPORT_PAYLOAD = {
+    'owner_profile': {
+        'name': 'Imported Owner',
+        'title': 'Architect',
+        'email': 'imported@example.com',
+        'years_experience': 9,
+        'projects_completed': 50,
+        'contributions': 500,
+        'clients_served': 20,
+        'certifications': 4,
+        'skills': ['Python', 'Flask'],
+        'experience': [{'company': 'Acme'}],
+        'expertise': [{'domain': 'Security'}],
+    },
+    'site_config': {
+        'site_name': 'Imported Site',
+        'tagline': 'Imported Tagline',
+        'mail_server': 'smtp.example.com',
+        'mail_port': 2525,
+        'mail_use_tls': True,
+        'blog_enabled': False,
+        'products_enabled': True,
+        'analytics_enabled': True,
+    },
+}
+
+
+@pytest.mark.parametrize('path,model,expected', [
+    pytest.param(
+        '/admin/owner-profile',
+        OwnerProfile,
+        {'name': 'Portfolio Owner', 'email': 'contact@example.com'},
+        id='owner-profile',
+    ),
+    pytest.param(
+        '/admin/site-config',
+        SiteConfig,
+        {'site_name': 'Developer Portfolio', 'blog_enabled': True, 'products_enabled': True},
+        id='site-config',
+    ),
+])
+def test_settings_page_creates_default_when_missing(modular_app, modular_client, path, model, expected):
     with modular_app.app_context():
-        owner = OwnerProfile.query.first()
-        assert owner is not None
-        assert owner.name == 'Portfolio Owner'
-        assert owner.email == 'contact@example.com'
-
-
-def test_owner_profile_invalid_numeric_value_returns_form(modular_client, modular_app):
-    login_admin(modular_client)
-
-    response = modular_client.post('/admin/owner-profile', data={
-        'name': 'Test',
-        'title': 'Engineer',
-        'email': 'test@example.com',
-        'years_experience': 'invalid-number',
-        'skills_json': '[]',
-        'experience_json': '[]',
-        'expertise_json': '[]',
-    })
+        model.query.delete()
+        db.session.commit()
 
+    response = modular_client.get(path)
     assert response.status_code == 200
-    assert b'Owner Profile' in response.data
 
     with modular_app.app_context():
-        # Invalid numeric input should not persist partial owner changes.
-        owner = OwnerProfile.query.first()
-        assert owner is not None
-        assert owner.name == 'Portfolio Owner'
-        assert owner.years_experience == 0
+        row = model.query.first()
+        assert row is not None
+        assert {name: getattr(row, name) for name in expected} == expected
 
 
-def test_owner_profile_invalid_json_returns_form(modular_client, modular_app):
-    login_admin(modular_client)
-
+@pytest.mark.parametrize('field,value,column,unchanged', [
+    pytest.param('years_experience', 'invalid-number', 'years_experience', 0, id='invalid-number'),
+    pytest.param('skills_json', '{bad json}', 'skills_json', '[]', id='invalid-json'),
+])
+def test_owner_profile_invalid_input_returns_form(modular_app, modular_client, field, value, column, unchanged):
     response = modular_client.post('/admin/owner-profile', data={
+        **BASE_OWNER_PAYLOAD,
         'name': 'Test',
-        'title': 'Engineer',
-        'email': 'test@example.com',
-        'years_experience': '1',
-        'projects_completed': '2',
-        'contributions': '3',
-        'clients_served': '4',
-        'certifications': '5',
-        'skills_json': '{bad json}',
-        'experience_json': '[]',
-        'expertise_json': '[]',
+        field: value,
     })
 
     assert response.status_code == 200
     assert b'Owner Profile' in response.data
 
+    # Invalid input should not persist partial owner changes.
     with modular_app.app_context():
-        # Invalid JSON should not persist partial owner changes.
         owner = OwnerProfile.query.first()
         assert owner is not None
         assert owner.name == 'Portfolio Owner'
-        assert owner.skills_json == '[]'
-
+        assert getattr(owner, column) == unchanged
 
-def test_owner_profile_keeps_existing_image_when_field_empty(modular_client, modular_app):
-    login_admin(modular_client)
 
+def test_owner_profile_keeps_existing_image_when_field_empty(modular_app, modular_client):
     with modular_app.app_context():
         owner = OwnerProfile(
             name='Existing',
@@ -130,91 +151,59 @@ def test_owner_profile_keeps_existing_image_when_field_empty(modular_client, mod
         )
         db.session.add(owner)
         db.session.commit()
+        owner_id = owner.id
 
     response = modular_client.post('/admin/owner-profile', data={
+        **BASE_OWNER_PAYLOAD,
         'name': 'Existing',
         'title': 'Dev',
         'email': 'existing@example.com',
         'profile_image': '',
-        'years_experience': '1',
-        'projects_completed': '1',
-        'contributions': '1',
-        'clients_served': '1',
-        'certifications': '1',
-        'skills_json': '[]',
-        'experience_json': '[]',
-        'expertise_json': '[]',
-    }, follow_redirects=False)
+    })
 
     assert response.status_code == 302
 
     with modular_app.app_context():
-        owner = OwnerProfile.query.first()
+        db.session.expire_all()
+        owner = db.session.get(OwnerProfile, owner_id)
+        assert owner.name == 'Existing'
         assert owner.profile_image == '/static/images/existing.png'
 
 
-def test_site_config_creates_default_when_missing(modular_client, modular_app):
-    login_admin(modular_client)
-
-    with modular_app.app_context():
-        SiteConfig.query.delete()
-        db.session.commit()
-
-    response = modular_client.get('/admin/site-config')
-    assert response.status_code == 200
-
-    with modular_app.app_context():
-        config = SiteConfig.query.first()
-        assert config is not None
-        assert config.site_name == 'Developer Portfolio'
-        assert config.blog_enabled is True
-        assert config.products_enabled is True
-
-
-def test_site_config_invalid_mail_port_defaults_to_587(modular_client, modular_app):
-    login_admin(modular_client)
-
+def test_site_config_invalid_mail_port_defaults_to_587(modular_app, modular_client):
     response = modular_client.post('/admin/site-config', data={
         'site_name': 'Config Test',
         'mail_port': 'not-a-number',
-    }, follow_redirects=False)
+    })
 
     assert response.status_code == 302
 
     with modular_app.app_context():
-        config = SiteConfig.query.first()
-        assert config.mail_port == 587
-
-
-def test_site_config_import_error_path_still_succeeds(modular_client, modular_app, monkeypatch):
-    login_admin(modular_client)
-
-    original_import = builtins.__import__
+        assert db.session.scalar(select(SiteConfig.mail_port)) == 587
 
-    def import_with_app_failure(name, globals=None, locals=None, fromlist=(), level=0):
-        if name == 'app':
-            raise ImportError('simulated import error for tests')
-        return original_import(name, globals, locals, fromlist, level)
 
-    monkeypatch.setattr(builtins, '__import__', import_with_app_failure)
+def test_site_config_import_error_path_still_succeeds(modular_app, modular_client, monkeypatch):
+    # A None entry makes the route's `from app.app import ...` raise ImportError
+    monkeypatch.setitem(sys.modules, 'app.app', None)
 
     response = modular_client.post('/admin/site-config', data={
         'site_name': 'No App Import',
         'mail_port': '587',
-    }, follow_redirects=False)
+    })
 
     assert response.status_code == 302
-    assert '/admin/site-config' in response.headers.get('Location', '')
+    assert '/admin/site-config' in response.location
 
     with modular_app.app_context():
         config = SiteConfig.query.first()
         assert config is not None
         assert config.site_name == 'No App Import'
+    with modular_client.session_transaction() as sess:
+        # The ImportError branch flashes the message without the email reload note
+        assert sess['_flashes'] == [('success', 'Site configuration updated successfully!')]
 
 
-def test_export_config_handles_missing_records(modular_client, modular_app):
-    login_admin(modular_client)
-
+def test_export_config_handles_missing_records(modular_app, modular_client):
     with modular_app.app_context():
         OwnerProfile.query.delete()
         SiteConfig.query.delete()
@@ -229,16 +218,12 @@ def test_export_config_handles_missing_records(modular_client, modular_app):
 
 
 def test_import_config_rejects_missing_form_payload(modular_client):
-    login_admin(modular_client)
-
     response = modular_client.post('/admin/import-config', data={})
     assert response.status_code == 400
     assert response.get_json()['success'] is False
 
 
 def test_import_config_rejects_invalid_form_json(modular_client):
-    login_admin(modular_client)
-
     response = modular_client.post('/admin/import-config', data={
         'config_data': '{not-valid-json}'
     })
@@ -246,44 +231,14 @@ def test_import_config_rejects_invalid_form_json(modular_client):
     assert response.get_json()['success'] is False
 
 
-def test_import_config_creates_owner_and_site_from_json(modular_client, modular_app):
-    login_admin(modular_client)
-
-    payload = {
-        'owner_profile': {
-            'name': 'Imported Owner',
-            'title': 'Architect',
-            'email': 'imported@example.com',
-            'years_experience': 9,
-            'projects_completed': 50,
-            'contributions': 500,
-            'clients_served': 20,
-            'certifications': 4,
-            'skills': ['Python', 'Flask'],
-            'experience': [{'company': 'Acme'}],
-            'expertise': [{'domain': 'Security'}],
-        },
-        'site_config': {
-            'site_name': 'Imported Site',
-            'tagline': 'Imported Tagline',
-            'mail_server': 'smtp.example.com',
-            'mail_port': 2525,
-            'mail_use_tls': True,
-            'blog_enabled': False,
-            'products_enabled': True,
-            'analytics_enabled': True,
-        },
-    }
-
-    response = modular_client.post('/admin/import-config', json=payload)
+def test_import_config_creates_owner_and_site_from_json(modular_app, modular_client):
+    response = modular_client.post('/admin/import-config', json=IMPORT_PAYLOAD)
     assert response.status_code == 200
     assert response.get_json()['success'] is True
 
     with modular_app.app_context():
-        owner = OwnerProfile.query.first()
-        config = SiteConfig.query.first()
-        assert owner is not None
-        assert config is not None
+        # Both singleton rows come back from one query
+        owner, config = db.session.execute(select(OwnerProfile, SiteConfig).join(SiteConfig, true())).one()
         assert owner.name == 'Imported Owner'
         assert json.loads(owner.skills_json) == ['Python', 'Flask']
         assert config.site_name == 'Imported Site'
@@ -291,9 +246,7 @@ def test_import_config_creates_owner_and_site_from_json(modular_client, modular_
         assert config.blog_enabled is False
 
 
-def test_import_config_rolls_back_on_invalid_owner_payload(modular_client, modular_app):
-    login_admin(modular_client)
-
+def test_import_config_rolls_back_on_invalid_owner_payload(modular_app, modular_client):
     # owner_profile should be a dict; passing string forces AttributeError (.get)
     response = modular_client.post('/admin/import-config', json={
         'owner_profile': 'invalid-shape'
@@ -306,18 +259,16 @@ def test_import_config_rolls_back_on_invalid_owner_payload(modular_client, modul
 
 
 def test_contact_info_and_about_info_redirect_to_owner_profile(modular_client):
-    login_admin(modular_client)
-
-    contact_response = modular_client.get('/admin/contact-info', follow_redirects=False)
-    about_response = modular_client.get('/admin/about-info', follow_redirects=False)
+    contact_response = modular_client.get('/admin/contact-info')
+    about_response = modular_client.get('/admin/about-info')
 
     assert contact_response.status_code == 302
     assert about_response.status_code == 302
-    assert '/admin/owner-profile' in contact_response.headers.get('Location', '')
-    assert '/admin/owner-profile' in about_response.headers.get('Location', '')
+    assert '/admin/owner-profile' in contact_response.location
+    assert '/admin/owner-profile' in about_response.location
 
 
-def test_contact_info_requires_authentication(modular_client):
-    response = modular_client.get('/admin/contact-info', follow_redirects=False)
+def test_contact_info_requires_authentication(anonymous_client):
+    response = anonymous_client.get('/admin/contact-info')
     assert response.status_code == 302
-    assert '/admin/login' in response.headers.get('Location', '')
+    assert '/admin/login' in response.location
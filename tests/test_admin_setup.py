@@ -1,81 +1,37 @@
 """
-Quick test to verify admin panel setup
+Smoke tests for the admin panel setup: blueprint, hashing, config and templates.
 """
-import os
+import pytest
+from werkzeug.security import generate_password_hash, check_password_hash
 
-print("Testing admin panel setup...\n")
 
-# Test 1: Check if admin_routes.py exists
-try:
-    import app.admin_routes  # noqa: F401
-    print("✅ admin_routes.py found")
-except ImportError as e:
-    print(f"❌ admin_routes.py not found: {e}")
-    exit(1)
+ADMIN_TEMPLATES = [
+    'admin/login.html',
+    'admin/dashboard.html',
+    'admin/projects.html',
+    'admin/blog.html',
+]
 
-# Test 2: Check if werkzeug is available for password hashing
-try:
-    from werkzeug.security import generate_password_hash, check_password_hash
-    print("✅ werkzeug security available")
-except ImportError:
-    print("❌ werkzeug not available - run: pip install werkzeug")
-    exit(1)
 
-# Test 3: Test password hashing
-try:
-    test_password = "password"
-    test_hash = generate_password_hash(test_password)
-    if check_password_hash(test_hash, test_password):
-        print("✅ Password hashing works correctly")
-    else:
-        print("❌ Password hashing test failed")
-except Exception as e:
-    print(f"❌ Password hashing error: {e}")
+def test_password_hashing_round_trip():
+    """Hashes produced by werkzeug should verify against the original password."""
+    # One PBKDF2 round is enough to check the hash/verify contract
+    password_hash = generate_password_hash('password', method='pbkdf2:sha256:1')
+    assert check_password_hash(password_hash, 'password')
+    assert not check_password_hash(password_hash, 'wrong-password')
 
-# Test 4: Check SECRET_KEY
-try:
-    from app import app
-    if app.config.get('SECRET_KEY'):
-        print("✅ SECRET_KEY configured")
-    else:
-        print("⚠️  SECRET_KEY not set")
-except Exception as e:
-    print(f"❌ Error checking SECRET_KEY: {e}")
 
-# Test 5: Check if admin blueprint is registered
-try:
-    from app import app
-    blueprints = [bp.name for bp in app.blueprints.values()]
-    if 'admin' in blueprints:
-        print("✅ Admin blueprint registered")
-    else:
-        print("❌ Admin blueprint not registered")
-except Exception as e:
-    print(f"❌ Error checking blueprint: {e}")
+def test_secret_key_configured(app):
+    """The app should have a SECRET_KEY for signing admin sessions."""
+    assert app.config.get('SECRET_KEY')
 
-# Test 6: Check template files
-template_files = [
-    'templates/admin/login.html',
-    'templates/admin/dashboard.html',
-    'templates/admin/projects.html',
-    'templates/admin/blog.html'
-]
-missing_templates = []
-for template in template_files:
-    if not os.path.exists(template):
-        missing_templates.append(template)
 
-if not missing_templates:
-    print("✅ All admin templates found")
-else:
-    print(f"⚠️  Missing templates: {', '.join(missing_templates)}")
+def test_admin_blueprint_registered(app):
+    """The legacy admin blueprint should be registered on the app."""
+    assert 'admin' in app.blueprints
+
 
-print("\n" + "="*50)
-print("Setup verification complete!")
-print("="*50)
-print("\nTo start using the admin panel:")
-print("1. Run: python app.py")
-print("2. Visit: http://localhost:5000/admin")
-print("3. Login: admin / password")
-print("\nTo set custom password:")
-print("Run: python scripts/generate_password.py")
+@pytest.mark.parametrize('template', ADMIN_TEMPLATES)
+def test_admin_template_exists(app, template):
+    """Core admin templates should be resolvable by the Jinja loader."""
+    assert app.jinja_env.get_template(template) is not None
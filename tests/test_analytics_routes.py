@@ -1,10 +1,50 @@
 """
 Tests for Analytics routes (dashboard and event tracking).
 """
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert
+
 from app.models import db, Newsletter, AnalyticsEvent
 from unittest.mock import patch
 
 
+CLICK_EVENT = {'event_type': 'click', 'event_name': 'test-button'}
+MINIMAL_EVENT = {'event_type': 'pageview'}
+
+
+@pytest.fixture
+def newsletter_subscriber(database):
+    """Add one confirmed subscriber, rolled back with the test's transaction"""
+    db.session.execute(insert(Newsletter).values(
+        email='test@example.com',
+        active=True,
+        confirmed=True,
+        confirmation_token='token123'
+    ))
+
+
+@pytest.fixture
+def mock_analytics():
+    """Patch the dashboard's analytics helpers with canned summary and traffic data"""
+    with patch('app.utils.analytics_utils.get_analytics_summary') as summary, \
+         patch('app.utils.analytics_utils.get_daily_traffic') as traffic:
+        summary.return_value = {
+            'total_views': 100,
+            'unique_sessions': 50,
+            'avg_pages_per_session': 2.0,
+            'popular_pages': [],
+            'referrer_stats': [],
+            'device_stats': {},
+            'browser_stats': {},
+            'new_visitors': 30,
+            'returning_visitors': 20,
+        }
+        traffic.return_value = []
+        yield SimpleNamespace(summary=summary, traffic=traffic)
+
+
 class TestAnalyticsDashboard:
     """Test analytics dashboard page."""
     
@@ -15,108 +55,44 @@ class TestAnalyticsDashboard:
         # Should redirect to login or return 401/403
         assert response.status_code in [302, 401, 403]
     
-    def test_analytics_dashboard_route_calls_utils(self, auth_client, database):
-        """Test analytics dashboard route calls utility functions."""
-        client = auth_client
+    @pytest.mark.parametrize('query,days', [
+        pytest.param('', 30, id='default'),
+        pytest.param('?days=7', 7, id='days-param'),
+    ])
+    def test_analytics_dashboard_calls_utils_with_days(
+        self, auth_client, newsletter_subscriber, mock_analytics, query, days
+    ):
+        """Test analytics dashboard passes the requested window (30 days by default) to the utils."""
+        mock_analytics.traffic.return_value = [
+            {'date': '2024-01-01', 'views': 10},
+            {'date': '2024-01-02', 'views': 15}
+        ]
         
-        # Create sample newsletter data for the route
-        newsletter = Newsletter(
-            email='test@example.com',
-            active=True,
-            confirmed=True,
-            confirmation_token='token123'
-        )
-        db.session.add(newsletter)
-        db.session.commit()
-        
-        # Mock analytics utilities and database queries
-        with patch('app.utils.analytics_utils.get_analytics_summary') as mock_summary, \
-             patch('app.utils.analytics_utils.get_daily_traffic') as mock_traffic:
-            
-            mock_summary.return_value = {
-                'total_views': 100,
-                'unique_sessions': 50,
-                'avg_pages_per_session': 2.0,
-                'popular_pages': [],
-                'referrer_stats': [],
-                'device_stats': {},
-                'browser_stats': {},
-                'new_visitors': 30,
-                'returning_visitors': 20,
-            }
-            mock_traffic.return_value = [
-                {'date': '2024-01-01', 'views': 10},
-                {'date': '2024-01-02', 'views': 15}
-            ]
-            
-            response = client.get('/admin/analytics')
-            
-            assert response.status_code == 200
-            # Verify utility functions were called with default 30 days
-            mock_summary.assert_called_once_with(30)
-            mock_traffic.assert_called_once_with(30)
-    
-    def test_analytics_dashboard_accepts_days_parameter(self, auth_client, database):
-        """Test analytics dashboard accepts days query parameter."""
-        client = auth_client
-        
-        # Create sample newsletter data
-        newsletter = Newsletter(
-            email='test2@example.com',
-            active=True,
-            confirmed=True,
-            confirmation_token='token456'
-        )
-        db.session.add(newsletter)
-        db.session.commit()
+        response = auth_client.get('/admin/analytics' + query)
         
-        with patch('app.utils.analytics_utils.get_analytics_summary') as mock_summary, \
-             patch('app.utils.analytics_utils.get_daily_traffic') as mock_traffic:
-            
-            mock_summary.return_value = {
-                'total_views': 100,
-                'unique_sessions': 50,
-                'avg_pages_per_session': 2.0,
-                'popular_pages': [],
-                'referrer_stats': [],
-                'device_stats': {},
-                'browser_stats': {},
-                'new_visitors': 30,
-                'returning_visitors': 20,
-            }
-            mock_traffic.return_value = []
-            
-            response = client.get('/admin/analytics?days=7')
-            
-            assert response.status_code == 200
-            # Verify the function was called with days=7
-            mock_summary.assert_called_once_with(7)
-            mock_traffic.assert_called_once_with(7)
+        assert response.status_code == 200
+        mock_analytics.summary.assert_called_once_with(days)
+        mock_analytics.traffic.assert_called_once_with(days)
 
-    def test_analytics_dashboard_handles_empty_newsletter_table(self, auth_client, database):
+    def test_analytics_dashboard_handles_empty_newsletter_table(self, auth_client, database, mock_analytics):
         """Analytics dashboard should not fail when newsletter table is empty."""
-        client = auth_client
         Newsletter.query.delete()
         db.session.commit()
+        mock_analytics.summary.return_value = {
+            'total_views': 0,
+            'unique_sessions': 0,
+            'avg_pages_per_session': 0,
+            'popular_pages': [],
+            'referrer_stats': [],
+            'device_stats': {},
+            'browser_stats': {},
+            'new_visitors': 0,
+            'returning_visitors': 0,
+        }
 
-        with patch('app.utils.analytics_utils.get_analytics_summary') as mock_summary, \
-             patch('app.utils.analytics_utils.get_daily_traffic') as mock_traffic:
-            mock_summary.return_value = {
-                'total_views': 0,
-                'unique_sessions': 0,
-                'avg_pages_per_session': 0,
-                'popular_pages': [],
-                'referrer_stats': [],
-                'device_stats': {},
-                'browser_stats': {},
-                'new_visitors': 0,
-                'returning_visitors': 0,
-            }
-            mock_traffic.return_value = []
-
-            response = client.get('/admin/analytics')
+        response = auth_client.get('/admin/analytics')
 
-            assert response.status_code == 200
+        assert response.status_code == 200
 
 
 class TestEventTracking:
@@ -144,8 +120,7 @@ class TestEventTracking:
             
             response = client.post(
                 '/api/analytics/event',
-                json=data,
-                headers={'Content-Type': 'application/json'}
+                json=data
             )
             
             assert response.status_code == 201
@@ -163,15 +138,9 @@ class TestEventTracking:
     
     def test_track_event_no_session(self, client):
         """Test event tracking fails without session cookie."""
-        data = {
-            'event_type': 'click',
-            'event_name': 'test-button'
-        }
-        
         response = client.post(
             '/api/analytics/event',
-            json=data,
-            headers={'Content-Type': 'application/json'}
+            json=CLICK_EVENT
         )
         
         assert response.status_code == 400
@@ -185,15 +154,9 @@ class TestEventTracking:
         with patch('app.utils.analytics_utils.track_event') as mock_track:
             mock_track.return_value = None  # Simulate tracking failure
             
-            data = {
-                'event_type': 'click',
-                'event_name': 'test-button'
-            }
-            
             response = client.post(
                 '/api/analytics/event',
-                json=data,
-                headers={'Content-Type': 'application/json'}
+                json=CLICK_EVENT
             )
             
             assert response.status_code == 500
@@ -207,15 +170,9 @@ class TestEventTracking:
         with patch('app.utils.analytics_utils.track_event') as mock_track:
             mock_track.side_effect = Exception('Database error')
             
-            data = {
-                'event_type': 'click',
-                'event_name': 'test-button'
-            }
-            
             response = client.post(
                 '/api/analytics/event',
-                json=data,
-                headers={'Content-Type': 'application/json'}
+                json=CLICK_EVENT
             )
             
             assert response.status_code == 500
@@ -232,12 +189,9 @@ class TestEventTracking:
             )
             
             # Minimal data - only event_type
-            data = {'event_type': 'pageview'}
-            
             response = client.post(
                 '/api/analytics/event',
-                json=data,
-                headers={'Content-Type': 'application/json'}
+                json=MINIMAL_EVENT
             )
             
             assert response.status_code == 201
@@ -264,8 +218,7 @@ class TestEventTracking:
             
             response = client.post(
                 '/api/analytics/event',
-                json=data,
-                headers={'Content-Type': 'application/json'}
+                json=data
             )
             
             assert response.status_code == 201
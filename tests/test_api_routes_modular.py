@@ -66,7 +66,7 @@ def _install_email_task_stubs(
     monkeypatch.setitem(sys.modules, 'app.tasks.email_tasks', fake_module)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def modular_app():
     app = create_app('testing')
     app.config.update(
@@ -77,18 +77,13 @@ def modular_app():
     )
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
-
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
+    return app
 
 
 @pytest.fixture
-def modular_client(modular_app):
+def modular_client(modular_app, modular_database):
     return modular_app.test_client()
 
 
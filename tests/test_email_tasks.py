@@ -0,0 +1,88 @@
+"""
+Tests for Celery email tasks.
+"""
+import smtplib
+from unittest.mock import patch
+
+from app.tasks import email_tasks
+
+
+class TestDispatchNewsletter:
+    """Test suite for newsletter fan-out."""
+
+    @patch('app.tasks.email_tasks.group')
+    def test_dispatch_newsletter_chunks_subscribers(self, mock_group):
+        """Test subscribers are split into one batch task per chunk."""
+        emails = [f'user{i}@example.com' for i in range(5)]
+        content = {'title': 'Monthly Update'}
+
+        email_tasks.dispatch_newsletter(emails, content, batch_size=2)
+
+        signatures = list(mock_group.call_args[0][0])
+        assert [sig.args[0] for sig in signatures] == [emails[0:2], emails[2:4], emails[4:5]]
+        assert all(sig.args[1] == content for sig in signatures)
+        assert all(sig.task == 'tasks.email_tasks.send_newsletter_batch' for sig in signatures)
+        mock_group.return_value.apply_async.assert_called_once_with()
+
+    @patch('app.tasks.email_tasks.send_newsletter')
+    def test_send_newsletter_batch_sends_each_subscriber(self, mock_send):
+        """Test the batch task sends to every subscriber in its chunk."""
+        mock_send.side_effect = lambda email, _content: {'success': True, 'email': email}
+
+        results = email_tasks.send_newsletter_batch(['a@example.com', 'b@example.com'], {'title': 'Hi'})
+
+        assert [r['email'] for r in results] == ['a@example.com', 'b@example.com']
+        assert mock_send.call_count == 2
+
+
+class TestSendNewsletter:
+    """Test suite for the single-subscriber newsletter task."""
+
+    @patch('app.tasks.email_tasks.mail')
+    def test_send_newsletter_strips_html_for_text_body(self, mock_mail, database, monkeypatch):
+        """Test the plain-text body falls back to the tag-stripped content."""
+        monkeypatch.setitem(email_tasks.app.config, 'MAIL_SUPPRESS_SEND', False)
+
+        result = email_tasks.send_newsletter(
+            'reader@example.com',
+            {'title': 'Update', 'content': '<p>Hello <strong>there</strong></p>'}
+        )
+
+        assert result == {'success': True, 'email': 'reader@example.com'}
+        msg = mock_mail.send.call_args[0][0]
+        assert msg.body == 'Hello there'
+        assert 'Test Developer' in msg.html
+
+    @patch('app.tasks.email_tasks.render_template')
+    @patch('app.tasks.email_tasks.mail')
+    def test_send_newsletter_short_circuits_when_suppressed(self, mock_mail, mock_render, app, monkeypatch):
+        """Test suppressed test runs skip rendering and sending entirely."""
+        monkeypatch.setitem(email_tasks.app.config, 'TESTING', True)
+        monkeypatch.setitem(email_tasks.app.config, 'MAIL_SUPPRESS_SEND', True)
+
+        result = email_tasks.send_newsletter('reader@example.com', {'title': 'Update'})
+
+        assert result == {'success': True, 'email': 'reader@example.com', 'suppressed': True}
+        mock_render.assert_not_called()
+        mock_mail.send.assert_not_called()
+
+
+class TestSendContactEmail:
+    """Test suite for contact email retries."""
+
+    @patch('app.tasks.email_tasks.mail')
+    def test_smtp_errors_retry_then_fail(self, mock_mail, app, monkeypatch):
+        """Test SMTP failures are retried up to max_retries before failing."""
+        monkeypatch.setitem(email_tasks.app.config, 'MAIL_SUPPRESS_SEND', False)
+        mock_mail.send.side_effect = smtplib.SMTPServerDisconnected('down')
+
+        result = email_tasks.send_contact_email.apply(args=[{
+            'name': 'Test User',
+            'email': 'user@example.com',
+            'subject': 'Hello',
+            'message': 'Body'
+        }])
+
+        assert result.failed()
+        assert isinstance(result.result, smtplib.SMTPServerDisconnected)
+        assert mock_mail.send.call_count == email_tasks.send_contact_email.max_retries + 1
@@ -16,7 +16,7 @@ from app.models import AnalyticsEvent, CookieConsent, PageView, UserSession, db
 from app.routes import gdpr as gdpr_routes
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def modular_app():
     app = create_app('testing')
     app.config.update(
@@ -27,18 +27,13 @@ def modular_app():
     )
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
-
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
+    return app
 
 
 @pytest.fixture
-def modular_client(modular_app):
+def modular_client(modular_app, modular_database):
     return modular_app.test_client()
 
 
@@ -14,7 +14,7 @@ from app.models import BlogPost, PageView, Product, Project, RaspberryPiProject,
 from app.routes import public as public_routes
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def modular_app():
     app = create_app('testing')
     app.config.update(
@@ -25,18 +25,13 @@ def modular_app():
     )
 
     with app.app_context():
-        db.drop_all()
         db.create_all()
 
-    yield app
-
-    with app.app_context():
-        db.session.remove()
-        db.drop_all()
+    return app
 
 
 @pytest.fixture
-def modular_client(modular_app):
+def modular_client(modular_app, modular_database):
     return modular_app.test_client()
 
 